@@ -0,0 +1,76 @@
+"""
+Ferramenta de linha de comando para simular partidas em lote e comparar balanceamentos.
+
+Exemplos:
+    python batch_tool.py --runs 1000
+    python batch_tool.py --runs 500 --set ENEMY_SPEED=3,4,5 --set SPAWN_RATE=40,60 --output lote.jsonl
+    python batch_tool.py --runs 200 --policy sweep --workers 4 --max-ticks 3600
+"""
+import argparse
+import json
+import os
+import sys
+
+from src.batch import POLICIES, RECORD_FIELDS, BatchSummary, run_batch, settings_grid
+from src.config import BATCH_MAX_TICKS, ENTITY_BACKEND, TUNABLE_SETTINGS
+
+
+def parse_sweep(values):
+    """Converte ['ENEMY_SPEED=3,4'] em {'ENEMY_SPEED': [3, 4]}."""
+    sweep = {}
+    for item in values or ():
+        name, _, raw = item.partition('=')
+        name = name.strip().upper()
+        if name not in TUNABLE_SETTINGS:
+            raise SystemExit(f"Configuração não ajustável: {name} (use {', '.join(TUNABLE_SETTINGS)})")
+        try:
+            sweep[name] = [int(v) for v in raw.split(',') if v.strip()]
+        except ValueError:
+            raise SystemExit(f"Valores inválidos para {name}: {raw}")
+    return sweep
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simula partidas headless em vários processos.")
+    parser.add_argument('--runs', type=int, default=1000, help="partidas por combinação de configurações")
+    parser.add_argument('--set', action='append', metavar='NOME=V1,V2',
+                        help="valores de uma configuração a varrer (pode repetir)")
+    parser.add_argument('--policy', choices=POLICIES, default='aim', help="bot que controla o jogador")
+    parser.add_argument('--seed', type=int, default=0, help="seed da primeira partida de cada combinação")
+    parser.add_argument('--max-ticks', type=int, default=BATCH_MAX_TICKS, help="duração máxima de uma partida")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="processos simultâneos")
+    parser.add_argument('--backend', choices=('objects', 'arrays'), default=ENTITY_BACKEND)
+    parser.add_argument('--output', help="grava um registro JSON por partida (JSONL)")
+    args = parser.parse_args(argv)
+
+    configs = settings_grid(parse_sweep(args.set))
+    total = len(configs) * args.runs
+    summary = BatchSummary(configs, args.workers)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for record in run_batch(configs, args.runs, args.seed, args.policy, args.max_ticks,
+                                args.workers, args.backend):
+            summary.add(record)
+            if out:
+                row = dict(zip(RECORD_FIELDS, record))
+                row['settings'] = configs[record[1]]
+                out.write(json.dumps(row) + '\n')
+            if summary.runs % 100 == 0 or summary.runs == total:
+                print(f"\r{summary.runs:>8,}/{total:,} partidas  ({summary.ticks_per_sec:,.0f} ticks/s)",
+                      end='', file=sys.stderr, flush=True)
+    finally:
+        if out:
+            out.close()
+    print(file=sys.stderr)
+
+    print(f"{'configuração':<40} {'partidas':>8} {'média':>8} {'p50':>6} {'p95':>6} {'sobrev.':>8} {'ticks':>8}")
+    for settings, n, mean, p50, p95, survival, ticks in summary.rows():
+        label = ' '.join(f"{k}={v}" for k, v in settings.items()) or '(padrão)'
+        print(f"{label:<40} {n:>8} {mean:>8.1f} {p50:>6} {p95:>6} {survival:>8.1%} {ticks:>8.0f}")
+    print(f"\n{summary.total_ticks:,} ticks em {summary.wall_seconds:.1f}s: "
+          f"{summary.ticks_per_sec:,.0f} ticks/s no total, "
+          f"{summary.ticks_per_sec_per_core:,.0f} ticks/s por núcleo ({args.workers} processos)")
+
+
+if __name__ == "__main__":
+    main()
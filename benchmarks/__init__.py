@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Scripts de medição de desempenho. Execute a partir da raiz: python -m benchmarks.<nome>"""
@@ -0,0 +1,104 @@
+# benchmarks/leaderboard_scaling.py
+"""
+Latência das consultas do modo leaderboard conforme o número de linhas cresce (1k a 10M).
+
+Uso:
+    python -m benchmarks.leaderboard_scaling [--max-rows 10000000] [--queries 200]
+
+Para cada tamanho mede (média em microssegundos): posição, percentil, corte do top 10
+e do top 1000, e um save_score completo. A coluna legacy_rank é a consulta do modo
+padrão (COUNT(*) em rankings via idx_score), que cresce com o número de linhas acima.
+
+As consultas do leaderboard percorrem apenas score_counts (um registro por score distinto),
+então o custo depende da quantidade de scores distintos, não do total de linhas.
+Aqui os scores seguem o jogo (múltiplos de 10, 0 a 50.000 => 5.001 valores distintos).
+
+Resultado de referência (Linux, Python 3.11, média em microssegundos):
+
+        linhas   rank  percentil  top10  top1000   save  legacy_rank
+         1.000     47       130     16      620     88           40
+        10.000    178       574     13      303    210          263
+       100.000    194       589     10       46    224        2.550
+     1.000.000    181       501      6        8    183       26.506
+    10.000.000    154       684     10       10    221      313.773
+
+(Com poucas linhas o top1000 precisa percorrer todos os scores distintos; a partir daí
+todas as consultas do leaderboard ficam estáveis enquanto a legada cresce linearmente.)
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.ranking import RankingDB, SQL_COUNT_ABOVE
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+FILL_BATCH = 100_000
+
+
+def _mean_us(func, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter_ns()
+        func(*args)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return statistics.fmean(samples)
+
+
+def _fill(db, rng, count):
+    """Insere count linhas direto na conexão, em transações grandes (os triggers mantêm score_counts)."""
+    conn = db._conn
+    while count > 0:
+        n = min(count, FILL_BATCH)
+        rows = ((f"P{rng.randrange(10**6)}", rng.randint(0, 5000) * 10) for _ in range(n))
+        with conn:
+            conn.executemany('INSERT INTO rankings (player_name, score) VALUES (?, ?)', rows)
+        count -= n
+
+
+def run(max_rows=SIZES[-1], queries=200, seed=42):
+    """Retorna uma lista de (linhas, {métrica: média_us})."""
+    rng = random.Random(seed)
+    probe = [(rng.randint(0, 5000) * 10,) for _ in range(queries)]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = RankingDB(os.path.join(tmp, 'leaderboard.db'), synchronous='OFF', leaderboard=True)
+        rows = 0
+        for size in SIZES:
+            if size > max_rows:
+                break
+            _fill(db, rng, size - rows)
+            rows = size
+            legacy = lambda s: db._conn.execute(SQL_COUNT_ABOVE, (s,)).fetchone()
+            metrics = {
+                'rank': _mean_us(db.get_rank_position, probe),
+                'percentile': _mean_us(db.get_percentile, probe),
+                'top10': _mean_us(db.score_needed_for_top, [(10,)] * queries),
+                'top1000': _mean_us(db.score_needed_for_top, [(1000,)] * queries),
+                'save': _mean_us(db.save_score, [('BENCH', s) for (s,) in probe]),
+                'legacy_rank': _mean_us(legacy, probe),
+            }
+            rows += queries  # save_score também insere
+            results.append((size, metrics))
+        db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-rows', type=int, default=SIZES[-1], help='maior tamanho a medir')
+    parser.add_argument('--queries', type=int, default=200, help='consultas por métrica')
+    args = parser.parse_args()
+
+    header = None
+    for size, metrics in run(args.max_rows, args.queries):
+        if header is None:
+            header = f"{'linhas':>12} " + ' '.join(f"{name:>12}" for name in metrics)
+            print(header)
+        print(f"{size:>12,} " + ' '.join(f"{value:>12.1f}" for value in metrics.values()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/ranking_latency.py
+"""
+Latência por operação do RankingDB: conexão persistente (WAL) x uma conexão por chamada.
+
+Uso:
+    python -m benchmarks.ranking_latency [--ops 500]
+
+Resultado de referência (Linux, Python 3.11, 500 operações, média/p95 em microssegundos):
+
+    operação             conexão por chamada   persistente NORMAL   persistente FULL
+    save_score              1139 / 1558            63 / 71             164 / 228
+    get_rank_position         81 /   94             9 / 10              11 /  14
+    top_scores (sem cache)    94 /  133            39 / 48              46 /  61
+
+A maior parte do custo da versão antiga vem de abrir a conexão a cada chamada e do
+fsync do journal em modo DELETE a cada commit. O top_scores do RankingDB inclui a
+formatação das datas, que a versão antiga fazia fora da consulta.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from src.ranking import RankingDB
+
+
+class ConnectPerCallRanking:
+    """Reprodução do comportamento anterior: sqlite3.connect a cada operação, sem PRAGMAs."""
+
+    def __init__(self, db_path):
+        self._db_path = db_path
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS rankings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    player_name TEXT NOT NULL DEFAULT 'AAA',
+                    score INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_score ON rankings(score DESC)')
+
+    def save_score(self, player_name, score):
+        conn = sqlite3.connect(self._db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute('INSERT INTO rankings (player_name, score) VALUES (?, ?)', (player_name, score))
+            conn.commit()
+            cursor.execute('SELECT COUNT(*) FROM rankings WHERE score > ?', (score,))
+            position = cursor.fetchone()[0] + 1
+            cursor.execute(f'''
+                DELETE FROM rankings
+                WHERE id NOT IN (SELECT id FROM rankings ORDER BY score DESC LIMIT {100})
+            ''')
+            conn.commit()
+            return position
+        finally:
+            conn.close()
+
+    def get_rank_position(self, score):
+        conn = sqlite3.connect(self._db_path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM rankings WHERE score > ?', (score,)).fetchone()[0] + 1
+        finally:
+            conn.close()
+
+    def load_top_scores(self, limit=10):
+        conn = sqlite3.connect(self._db_path)
+        try:
+            return conn.execute(
+                'SELECT player_name, score, created_at FROM rankings ORDER BY score DESC LIMIT ?', (limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def close(self):
+        pass
+
+
+def _time_us(func, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter_ns()
+        func(*args)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    samples.sort()
+    return statistics.fmean(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def run(ops: int = 500, seed: int = 1234):
+    """Mede cada implementação e retorna {nome: {operação: (média_us, p95_us)}}."""
+    rng = random.Random(seed)
+    scores = [(f"P{i}", rng.randint(0, 500) * 10) for i in range(ops)]
+    queries = [(s,) for _, s in scores]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = {
+            'connect_per_call': lambda path: ConnectPerCallRanking(path),
+            'persistent_normal': lambda path: RankingDB(path, synchronous='NORMAL'),
+            'persistent_full': lambda path: RankingDB(path, synchronous='FULL'),
+        }
+        for name, factory in variants.items():
+            db = factory(os.path.join(tmp, f"{name}.db"))
+            if isinstance(db, RankingDB):
+                load_top = lambda: db._load_top_scores(10)
+            else:
+                load_top = db.load_top_scores
+            results[name] = {
+                'save_score': _time_us(db.save_score, scores),
+                'get_rank_position': _time_us(db.get_rank_position, queries),
+                'top_scores_uncached': _time_us(lambda: load_top(), [()] * ops),
+            }
+            db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ops', type=int, default=500, help='operações por medição')
+    args = parser.parse_args()
+
+    results = run(args.ops)
+    print(f"{'variante':<20} {'operação':<22} {'média (us)':>12} {'p95 (us)':>12}")
+    for name, ops in results.items():
+        for op, (mean, p95) in ops.items():
+            print(f"{name:<20} {op:<22} {mean:>12.1f} {p95:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
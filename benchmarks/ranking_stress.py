@@ -0,0 +1,86 @@
+# benchmarks/ranking_stress.py
+"""
+Teste de estresse com vários processos gravando no mesmo banco de ranking.
+
+Cada processo abre seu próprio RankingDB (modo leaderboard, para que nenhuma linha seja
+apagada pela limpeza) e grava pontuações com nomes únicos. No fim, confere que todas
+as pontuações estão no banco exatamente uma vez e que score_counts bate com a tabela.
+
+Uso:
+    python -m benchmarks.ranking_stress [--processes 8] [--scores 2000] [--async]
+
+Sai com código 1 se alguma pontuação se perdeu ou foi duplicada.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from src.ranking import RankingDB
+
+
+def _worker(db_path, worker_id, scores, async_writes, start_event):
+    rng = random.Random(worker_id)
+    start_event.wait()
+    with RankingDB(db_path, async_writes=async_writes, leaderboard=True, shared=True) as db:
+        for i in range(scores):
+            # Nome único de 10 caracteres: 2 dígitos do processo + 8 do contador
+            db.save_score(f"{worker_id:02d}{i:08d}", rng.randint(0, 5000) * 10)
+        db.flush()
+        return db.busy_retries
+
+
+def run(processes=8, scores=2000, async_writes=False):
+    """Executa o estresse e retorna um dicionário com o resultado da verificação."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'stress.db')
+        RankingDB(db_path, leaderboard=True).close()
+
+        with multiprocessing.Manager() as manager:
+            start_event = manager.Event()
+            with multiprocessing.Pool(processes) as pool:
+                jobs = [pool.apply_async(_worker, (db_path, w, scores, async_writes, start_event))
+                        for w in range(processes)]
+                start = time.perf_counter()
+                start_event.set()
+                retries = sum(job.get() for job in jobs)
+                elapsed = time.perf_counter() - start
+
+        conn = sqlite3.connect(db_path)
+        total, distinct = conn.execute('SELECT COUNT(*), COUNT(DISTINCT player_name) FROM rankings').fetchone()
+        counted = conn.execute('SELECT COALESCE(SUM(n), 0) FROM score_counts').fetchone()[0]
+        conn.close()
+
+    expected = processes * scores
+    return {
+        'expected': expected,
+        'rows': total,
+        'distinct_names': distinct,
+        'score_counts_total': counted,
+        'busy_retries': retries,
+        'seconds': elapsed,
+        'inserts_per_sec': expected / elapsed if elapsed > 0 else 0.0,
+        'ok': total == expected and distinct == expected and counted == expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--scores', type=int, default=2000, help='pontuações por processo')
+    parser.add_argument('--async', dest='async_writes', action='store_true',
+                        help='usa a thread de escrita com agrupamento de gravações')
+    args = parser.parse_args()
+
+    result = run(args.processes, args.scores, args.async_writes)
+    for key, value in result.items():
+        print(f"{key:>20}: {value:,.1f}" if isinstance(value, float) else f"{key:>20}: {value}")
+    sys.exit(0 if result['ok'] else 1)
+
+
+if __name__ == '__main__':
+    main()
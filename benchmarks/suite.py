@@ -0,0 +1,273 @@
+# benchmarks/suite.py
+"""
+Suíte de benchmarks reproduzível do jogo e do ranking (headless, random com seed fixa).
+
+Cenários:
+    swarm_1k      1.000 inimigos na tela o tempo todo
+    bullets_5k    5.000 tiros na tela e algumas dezenas de inimigos
+    long_session  partida longa (10 min de jogo) com spawn normal e um bot atirando
+    ranking_1m    operações do RankingDB (modo leaderboard) com 1.000.000 de linhas
+
+Para cada fase (update, collisions, draw, operações do banco) informa média, p95 e p99
+em microssegundos. "update" é o tick inteiro, incluindo "collisions". Uma segunda
+passada curta com tracemalloc mede as alocações por tick (fora da medição de tempo).
+
+Uso:
+    python -m benchmarks.suite --output resultados.json
+    python -m benchmarks.suite --baseline resultados.json   # compara e sai com 1 se houver regressão
+    python -m benchmarks.suite --scenario swarm_1k --backend arrays
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.config import *
+from src.controls import Controls
+
+SCENARIOS = ('swarm_1k', 'bullets_5k', 'long_session', 'ranking_1m')
+DEFAULT_TOLERANCE = 0.10
+
+
+# --- Estatística ---------------------------------------------------------------
+
+def summarize(samples_ns):
+    """Média, p95 e p99 (em microssegundos) de uma lista de durações em nanossegundos."""
+    if not samples_ns:
+        return {'n': 0, 'mean_us': 0.0, 'p95_us': 0.0, 'p99_us': 0.0}
+    ordered = sorted(samples_ns)
+    n = len(ordered)
+
+    def pct(p):
+        return ordered[min(n - 1, int(round(p * (n - 1))))] / 1000
+
+    return {
+        'n': n,
+        'mean_us': statistics.fmean(ordered) / 1000,
+        'p95_us': pct(0.95),
+        'p99_us': pct(0.99),
+    }
+
+
+def _timed(func, samples):
+    """Envolve func para registrar a duração de cada chamada em samples (ns)."""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter_ns() - start)
+    return wrapper
+
+
+# --- Cenários do jogo ------------------------------------------------------------
+
+def _make_game(backend, seed):
+    from src.game import Game
+    random.seed(seed)
+    game = Game(headless=True, render=True, entity_backend=backend, ranking=False)
+    game.start_game()
+    return game
+
+
+def _keep_alive(game):
+    """A partida nunca termina: o benchmark mede carga constante, não o game over."""
+    game.lives = PLAYER_LIVES
+    game.state = 'PLAYING'
+
+
+def _top_up(game, enemies, bullets, rng):
+    """Repõe inimigos (no topo) e tiros (embaixo) até os alvos do cenário."""
+    while len(game.enemies) < enemies:
+        game.spawn_enemy(rng.randint(0, SCREEN_WIDTH - ENEMY_SIZE[0]), rng.randint(-SCREEN_HEIGHT, -ENEMY_SIZE[1]))
+    while len(game.bullets) < bullets:
+        x = rng.randint(0, SCREEN_WIDTH - BULLET_SIZE[0])
+        y = rng.randint(SCREEN_HEIGHT // 2, SCREEN_HEIGHT)
+        if game.entity_backend == 'arrays':
+            game.bullets.spawn(x, y)
+        else:
+            game.bullets.append(game.bullet_pool.acquire(x, y))
+
+
+def _bot(tick):
+    """Bot simples: anda de um lado para o outro e atira a cada 8 ticks."""
+    phase = (tick // 90) % 2
+    return Controls(left=phase == 0, right=phase == 1, fire=1 if tick % 8 == 0 else 0)
+
+
+GAME_SCENARIOS = {
+    # nome: (inimigos mantidos, tiros mantidos, ticks, usa bot/spawn normal)
+    'swarm_1k': (1000, 20, 600, False),
+    'bullets_5k': (40, 5000, 600, False),
+    'long_session': (0, 0, 36000, True),
+}
+
+
+def _run_game(name, backend, seed, ticks_override=None, trace_alloc=False):
+    enemies, bullets, ticks, with_bot = GAME_SCENARIOS[name]
+    if ticks_override:
+        ticks = ticks_override
+    game = _make_game(backend, seed)
+    rng = random.Random(seed)
+    phases = {'update': [], 'collisions': [], 'draw': []}
+    game.check_collisions = _timed(game.check_collisions, phases['collisions'])
+
+    if trace_alloc:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+
+    for tick in range(ticks):
+        _top_up(game, enemies, bullets, rng)
+        controls = _bot(tick) if with_bot else None
+        start = time.perf_counter_ns()
+        game.update(controls)
+        mid = time.perf_counter_ns()
+        game.draw()
+        end = time.perf_counter_ns()
+        phases['update'].append(mid - start)
+        phases['draw'].append(end - mid)
+        _keep_alive(game)
+
+    if trace_alloc:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            'ticks': ticks,
+            'net_kb': (current - before) / 1024,
+            'peak_kb': (peak - before) / 1024,
+            'net_bytes_per_tick': (current - before) / ticks,
+        }
+    return {phase: summarize(samples) for phase, samples in phases.items()}
+
+
+# --- Cenário do ranking --------------------------------------------------------------
+
+def _run_ranking(rows, seed, queries=500):
+    from src.ranking import RankingDB
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = RankingDB(os.path.join(tmp, 'bench.db'), leaderboard=True)
+        db.import_scores((f"P{i}", rng.randint(0, 5000) * 10, None) for i in range(rows))
+        probes = [rng.randint(0, 5000) * 10 for _ in range(queries)]
+        phases = {name: [] for name in ('save_score', 'rank', 'percentile', 'is_high_score', 'top_uncached')}
+        for score in probes:
+            for name, call in (
+                ('save_score', lambda: db.save_score('BENCH', score)),
+                ('rank', lambda: db.get_rank_position(score)),
+                ('percentile', lambda: db.get_percentile(score)),
+                ('is_high_score', lambda: db.is_high_score(score)),
+                ('top_uncached', lambda: (db.invalidate_cache(), db.get_top_scores())),
+            ):
+                start = time.perf_counter_ns()
+                call()
+                phases[name].append(time.perf_counter_ns() - start)
+        db.close()
+    return {phase: summarize(samples) for phase, samples in phases.items()}
+
+
+# --- Execução e comparação -------------------------------------------------------------
+
+def run(scenarios=SCENARIOS, backend='objects', seed=1234, ranking_rows=1_000_000, ticks=None):
+    """Executa os cenários e retorna o dicionário de resultados (serializável em JSON)."""
+    import pygame
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'backend': backend,
+            'seed': seed,
+            'ranking_rows': ranking_rows,
+        },
+        'scenarios': {},
+    }
+    for name in scenarios:
+        if name == 'ranking_1m':
+            results['scenarios'][name] = {'phases': _run_ranking(ranking_rows, seed)}
+        else:
+            alloc_ticks = min(ticks or GAME_SCENARIOS[name][2], 300)
+            results['scenarios'][name] = {
+                'phases': _run_game(name, backend, seed, ticks),
+                'alloc': _run_game(name, backend, seed, alloc_ticks, trace_alloc=True),
+            }
+    return results
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compara média e p95 de cada fase com a linha de base.
+
+    Returns:
+        Lista de (cenário, fase, métrica, base, atual, variação) das regressões acima da tolerância
+    """
+    regressions = []
+    for name, data in current['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base:
+            continue
+        for phase, stats in data['phases'].items():
+            base_stats = base['phases'].get(phase)
+            if not base_stats:
+                continue
+            for metric in ('mean_us', 'p95_us'):
+                old, new = base_stats[metric], stats[metric]
+                if old > 0 and new > old * (1 + tolerance):
+                    regressions.append((name, phase, metric, old, new, new / old - 1))
+    return regressions
+
+
+def print_report(results):
+    for name, data in results['scenarios'].items():
+        print(f"\n== {name}")
+        print(f"  {'fase':<16} {'n':>7} {'média us':>11} {'p95 us':>11} {'p99 us':>11}")
+        for phase, stats in data['phases'].items():
+            print(f"  {phase:<16} {stats['n']:>7} {stats['mean_us']:>11.1f} "
+                  f"{stats['p95_us']:>11.1f} {stats['p99_us']:>11.1f}")
+        if 'alloc' in data:
+            alloc = data['alloc']
+            print(f"  alocações: pico {alloc['peak_kb']:.1f} KiB, líquido {alloc['net_kb']:.1f} KiB "
+                  f"({alloc['net_bytes_per_tick']:.1f} B/tick em {alloc['ticks']} ticks)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS,
+                        help='cenário a executar (pode repetir; padrão: todos)')
+    parser.add_argument('--backend', choices=('objects', 'arrays'), default='objects')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--ticks', type=int, help='substitui a duração (ticks) dos cenários do jogo')
+    parser.add_argument('--ranking-rows', type=int, default=1_000_000)
+    parser.add_argument('--output', help='grava os resultados em JSON')
+    parser.add_argument('--baseline', help='JSON de uma execução anterior para comparar')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='variação aceita antes de apontar regressão (0.10 = 10%%)')
+    args = parser.parse_args()
+
+    results = run(args.scenario or SCENARIOS, args.backend, args.seed, args.ranking_rows, args.ticks)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressões em relação à linha de base:")
+            for name, phase, metric, old, new, change in regressions:
+                print(f"  {name}/{phase} {metric}: {old:.1f} -> {new:.1f} (+{change:.0%})")
+            sys.exit(1)
+        print("\nSem regressões em relação à linha de base.")
+
+
+if __name__ == '__main__':
+    main()
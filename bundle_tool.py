@@ -0,0 +1,68 @@
+"""
+Ferramenta de linha de comando para gerar o pacote de assets pré-decodificados (src/bundle.py).
+
+Rode de novo sempre que mudar um PNG/MP3 ou a resolução interna (RENDER_WIDTH/RENDER_HEIGHT);
+até lá o jogo detecta o pacote desatualizado e decodifica os arquivos originais.
+
+Exemplos:
+    python bundle_tool.py
+    python bundle_tool.py --output /tmp/assets.bundle
+    python bundle_tool.py --check
+"""
+import argparse
+import os
+
+import pygame
+
+from src.bundle import AssetBundle, build_bundle
+from src.config import ASSET_BUNDLE_PATH
+from src.loader import SOUNDS, SPRITES
+
+
+def check(path, sounds):
+    """Informa quais assets do jogo seriam lidos do pacote e quais voltariam para PNG/MP3."""
+    bundle = AssetBundle.open(path)
+    if bundle is None:
+        print(f"{path}: pacote inexistente ou inválido")
+        return 1
+    stale = [os.path.basename(p) for p, size, alpha in SPRITES if bundle.image(p, size, alpha) is None]
+    stale += [os.path.basename(p) for p in sounds if bundle.sound(p) is None]
+    if stale:
+        print(f"{path}: desatualizado para {', '.join(stale)}")
+        return 1
+    print(f"{path}: em dia ({len(bundle)} assets)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera o pacote de sprites e sons já decodificados.")
+    parser.add_argument('--output', default=ASSET_BUNDLE_PATH, help="arquivo do pacote")
+    parser.add_argument('--check', action='store_true', help="só verifica se o pacote está em dia")
+    args = parser.parse_args(argv)
+
+    # O pacote não depende da janela; o mixer precisa estar no formato que o jogo vai abrir
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    sounds = SOUNDS
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Erro ao abrir o áudio: {e}")
+        print("Os sons ficarão de fora.")
+        sounds = ()
+
+    if args.check:
+        raise SystemExit(check(args.output, sounds))
+
+    index = build_bundle(args.output, SPRITES, sounds)
+    size = os.path.getsize(args.output)
+    audio = ''
+    if index['sounds']:
+        frequency, sample, channels = index['mixer']
+        audio = f" ({frequency} Hz, {abs(sample)} bits, {channels} canais)"
+    print(f"{args.output}: {len(index['images'])} imagens, {len(index['sounds'])} sons{audio}, "
+          f"{size / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Ferramenta de linha de comando para importar/exportar o ranking.
+
+Exemplos:
+    python ranking_tool.py export ranking.csv
+    python ranking_tool.py import torneio.jsonl --batch-size 50000 --leaderboard
+"""
+import argparse
+import sys
+
+from src.config import DB_PATH, RANKING_IMPORT_BATCH
+from src.ranking import RankingDB
+from src.ranking_io import FORMATS, import_file, export_file
+
+
+def print_progress(rows, rows_per_sec):
+    print(f"\r{rows:>12,} linhas  ({rows_per_sec:,.0f} linhas/s)", end='', file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa/exporta pontuações do ranking (CSV ou JSONL).")
+    parser.add_argument('command', choices=('import', 'export'))
+    parser.add_argument('path', help="arquivo .csv ou .jsonl")
+    parser.add_argument('--db', default=DB_PATH, help="banco SQLite do ranking")
+    parser.add_argument('--format', choices=FORMATS, help="formato do arquivo (padrão: pela extensão)")
+    parser.add_argument('--batch-size', type=int, default=RANKING_IMPORT_BATCH, help="linhas por transação")
+    parser.add_argument('--leaderboard', action='store_true',
+                        help="converte o banco para o modo leaderboard, que mantém o histórico completo "
+                             "(um banco já convertido continua nele mesmo sem esta opção)")
+    parser.add_argument('--quiet', action='store_true', help="não mostra o progresso")
+    args = parser.parse_args(argv)
+
+    progress = None if args.quiet else print_progress
+    with RankingDB(args.db, leaderboard=args.leaderboard or None) as db:
+        transfer = import_file if args.command == 'import' else export_file
+        stats = transfer(db, args.path, args.format, args.batch_size, progress)
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"{stats.rows:,} linhas em {stats.seconds:.2f}s ({stats.rows_per_sec:,.0f} linhas/s)")
+
+
+if __name__ == "__main__":
+    main()
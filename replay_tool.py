@@ -0,0 +1,46 @@
+"""
+Ferramenta de linha de comando para inspecionar e reproduzir replays gravados (REPLAY_RECORD).
+
+Exemplos:
+    python replay_tool.py info replays/20260101_120000_123456_12345.dgr
+    python replay_tool.py play replays/20260101_120000_123456_12345.dgr            # headless, o mais rápido possível
+    python replay_tool.py play replays/20260101_120000_123456_12345.dgr --realtime # na janela, a FPS
+"""
+import argparse
+import os
+import sys
+
+from src.config import ENTITY_BACKEND
+from src.replay import Replay, play_replay
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspeciona e reproduz replays de partidas.")
+    parser.add_argument('command', choices=('info', 'play'))
+    parser.add_argument('path', help="arquivo .dgr")
+    parser.add_argument('--realtime', action='store_true', help="reproduz na janela, em tempo real")
+    parser.add_argument('--backend', choices=('objects', 'arrays'), default=ENTITY_BACKEND)
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    size = os.path.getsize(args.path)
+    print(f"seed {replay.seed}, {replay.ticks:,} ticks, score {replay.score}, "
+          f"{size:,} bytes ({size / max(replay.ticks, 1):.3f} bytes/tick)")
+    if replay.settings:
+        print(' '.join(f"{name}={value}" for name, value in replay.settings.items()))
+    if not replay.matches_config():
+        print("Configuração diferente da atual")
+    if args.command == 'info':
+        return
+
+    result = play_replay(replay, realtime=args.realtime, entity_backend=args.backend)
+    print(f"{result.ticks:,} ticks em {result.seconds:.2f}s ({result.ticks_per_sec:,.0f} ticks/s), "
+          f"score {result.score} (gravado: {result.expected_score})")
+    if not result.ok:
+        where = f" no tick {result.desync_tick}" if result.desync_tick is not None else ""
+        print(f"Replay divergiu{where}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
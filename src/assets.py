@@ -0,0 +1,77 @@
+# src/assets.py
+"""
+Cache de superfícies (sprites) compartilhado por todo o processo.
+Evita que cada entidade criada leia, decodifique e redimensione o PNG novamente.
+"""
+import pygame
+
+
+class SpriteCache:
+    """
+    Guarda superfícies já convertidas e redimensionadas, indexadas por (caminho, tamanho).
+    Demonstra: Encapsulamento e reaproveitamento de recursos.
+    """
+
+    def __init__(self):
+        self._surfaces = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, image_path: str, size: tuple, alpha: bool = True) -> pygame.Surface:
+        """
+        Retorna a superfície do arquivo no tamanho pedido, carregando-a só na primeira vez.
+
+        A superfície devolvida é compartilhada: não deve ser modificada por quem a recebe.
+        """
+        key = (image_path, tuple(size), alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+        return self.put(image_path, size, self.decode(image_path, size), alpha)
+
+    @staticmethod
+    def decode(image_path: str, size: tuple) -> pygame.Surface:
+        """
+        Lê e redimensiona o arquivo sem converter para o formato da tela.
+        Não depende da janela, então pode rodar em uma thread de carregamento.
+        """
+        return pygame.transform.scale(pygame.image.load(image_path), tuple(size))
+
+    def put(self, image_path: str, size: tuple, surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """Converte uma superfície já decodificada (ver decode) e a guarda no cache."""
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        self._surfaces[(image_path, tuple(size), alpha)] = surface
+        return surface
+
+    def preload(self, entries):
+        """
+        Carrega antecipadamente uma lista de (caminho, tamanho[, alpha]).
+        Erros de carregamento são ignorados aqui e voltam a aparecer no uso real.
+        """
+        for entry in entries:
+            try:
+                self.get(*entry)
+            except Exception as e:
+                print(f"Erro ao pré-carregar {entry[0]}: {e}")
+
+    def clear(self):
+        """Descarta todas as superfícies (ex.: após trocar o modo de vídeo)."""
+        self._surfaces.clear()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Instância única usada pelas entidades e pelo jogo
+sprite_cache = SpriteCache()
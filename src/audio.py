@@ -0,0 +1,127 @@
+# src/audio.py
+"""
+Gerenciador de vozes dos efeitos sonoros.
+
+Em ondas densas dezenas de explosões podiam ser pedidas no mesmo tick, cada uma ocupando um
+canal do mixer. Aqui os pedidos de um tick são acumulados por categoria e, em flush(), viram
+uma única voz por categoria, com o volume crescendo com a raiz do número de pedidos (a soma
+de n sons iguais e descorrelacionados soa ~raiz(n) vezes mais alta). Cada categoria toca nos
+seus canais reservados; com todos ocupados, ela reaproveita o mais antigo que já tocou por
+SFX_STEAL_AFTER ticks, senão interrompe a voz mais antiga de uma categoria de prioridade menor
+(uma rajada de explosões pode calar tiros, mas não o contrário), senão o pedido é descartado.
+Um canal emprestado assim volta para a categoria dona pela mesma regra da idade.
+"""
+import math
+
+import pygame
+
+from src.config import SFX_CHANNELS, SFX_STEAL_AFTER
+
+
+class VoiceManager:
+    """
+    Pedidos: play(nome, quantidade) durante o tick, flush() no fim dele.
+    Sem sons carregados (bind nunca chamado ou sons None), tudo é no-op.
+    """
+
+    def __init__(self, categories: dict = None):
+        # nome -> (canais reservados, prioridade)
+        self._categories = dict(SFX_CHANNELS if categories is None else categories)
+        self._sounds = {}  # nome -> (som carregado, cópia tocada a volume 1.0)
+        self._pools = {}  # nome -> índices dos canais reservados
+        self._voices = {}  # índice do canal -> (categoria tocando, tick em que começou)
+        self._pending = {}  # nome -> pedidos acumulados neste tick
+        self._tick = 0
+        self.requested = 0
+        self.coalesced = 0  # Pedidos somados a outra voz do mesmo tick
+        self.played = 0
+        self.stolen = 0  # Vozes interrompidas para dar lugar a outra
+        self.dropped = 0  # Vozes não tocadas por falta de canal
+
+    def bind(self, sounds: dict):
+        """
+        Associa os sons carregados ({nome: pygame.mixer.Sound ou None}) às categorias e
+        reserva os canais. O volume de cada som é o volume base da categoria; os sons
+        recebidos não são alterados.
+        """
+        self._sounds.clear()
+        self._pools.clear()
+        self._voices.clear()
+        self._pending.clear()
+        loaded = [name for name, sound in sounds.items() if sound is not None and name in self._categories]
+        if not loaded:
+            return
+
+        first = 0
+        for name in loaded:
+            count = self._categories[name][0]
+            self._pools[name] = range(first, first + count)
+            first += count
+        if pygame.mixer.get_num_channels() < first:
+            pygame.mixer.set_num_channels(first)
+        # Sound.play() (escolha automática de canal) não usa os canais reservados
+        pygame.mixer.set_reserved(first)
+
+        for name in loaded:
+            sound = sounds[name]
+            # O volume final é volume do som x volume do canal (no máximo 1.0): para que pedidos
+            # somados passem do volume base, toca-se uma cópia das amostras a volume cheio e o
+            # volume base entra só no canal
+            self._sounds[name] = (sound, pygame.mixer.Sound(buffer=sound.get_raw()))
+
+    def play(self, name: str, count: int = 1):
+        """Pede count reproduções do som neste tick."""
+        if name in self._sounds:
+            self._pending[name] = self._pending.get(name, 0) + count
+            self.requested += count
+
+    def flush(self):
+        """Toca o que foi pedido no tick: uma voz por categoria, as mais prioritárias primeiro."""
+        self._tick += 1
+        if not self._pending:
+            return
+        pending = sorted(self._pending.items(), key=lambda item: -self._categories[item[0]][1])
+        self._pending.clear()
+        for name, count in pending:
+            self.coalesced += count - 1
+            channel_id = self._find_channel(name)
+            if channel_id is None:
+                self.dropped += 1
+                continue
+            sound, voice = self._sounds[name]
+            channel = pygame.mixer.Channel(channel_id)
+            channel.play(voice)
+            channel.set_volume(min(1.0, sound.get_volume() * math.sqrt(count)))
+            self._voices[channel_id] = (name, self._tick)
+            self.played += 1
+
+    def _find_channel(self, name: str):
+        """Canal livre ou reaproveitável da categoria, ou uma voz de prioridade menor, ou None."""
+        victim = None
+        for channel_id in self._pools[name]:
+            if not pygame.mixer.Channel(channel_id).get_busy():
+                return channel_id
+            started = self._started(channel_id)
+            if self._tick - started >= SFX_STEAL_AFTER and (victim is None or started < self._started(victim)):
+                victim = channel_id
+
+        if victim is None:
+            priority = self._categories[name][1]
+            for channel_id, (voice_name, started) in self._voices.items():
+                if self._categories[voice_name][1] >= priority or not pygame.mixer.Channel(channel_id).get_busy():
+                    continue
+                if victim is None or started < self._started(victim):
+                    victim = channel_id
+        if victim is not None:
+            pygame.mixer.Channel(victim).stop()
+            self.stolen += 1
+        return victim
+
+    def _started(self, channel_id: int) -> int:
+        # Canal tocando algo que não saiu daqui (ex.: antes do bind): conta como a voz mais antiga
+        voice = self._voices.get(channel_id)
+        return voice[1] if voice else -SFX_STEAL_AFTER
+
+    def stats(self) -> dict:
+        return {'requested': self.requested, 'coalesced': self.coalesced, 'played': self.played,
+                'stolen': self.stolen, 'dropped': self.dropped}
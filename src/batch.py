@@ -0,0 +1,193 @@
+# src/batch.py
+"""
+Simulação de partidas em lote, distribuída em vários processos.
+
+Cada partida roda headless (sem desenho, sem ranking) com sua própria seed e, opcionalmente,
+valores próprios de TUNABLE_SETTINGS. Um bot controla o jogador. Cada processo reaproveita
+uma única instância de Game e devolve uma tupla curta por partida, que chega ao processo
+principal assim que fica pronta (imap_unordered), sem acumular resultados nos workers.
+"""
+import itertools
+import multiprocessing
+import os
+import statistics
+import time
+
+from src.config import *
+from src.controls import Controls
+
+POLICIES = ('idle', 'sweep', 'aim')
+
+# Campos de cada registro devolvido pelos workers
+RECORD_FIELDS = ('run_id', 'config_id', 'seed', 'score', 'ticks', 'lives', 'survived', 'cpu_seconds')
+
+_game = None  # Instância de Game do processo worker
+_settings = None  # Configurações aplicadas a ela
+
+
+# --- Bots ---------------------------------------------------------------------------
+
+def _idle(game, tick):
+    return Controls()
+
+
+def _sweep(game, tick):
+    """Anda de um lado para o outro e atira a cada 8 ticks."""
+    phase = (tick // 90) % 2
+    return Controls(left=phase == 0, right=phase == 1, fire=1 if tick % 8 == 0 else 0)
+
+
+def _lowest_enemy_x(game):
+    """Centro x do inimigo mais próximo do jogador (o mais baixo), ou None."""
+    if game.entity_backend == 'arrays':
+        if not len(game.enemies):
+            return None
+        i = int(game.enemies.ys.argmax())
+        return int(game.enemies.xs[i]) + ENEMY_SIZE[0] // 2
+    if not game.enemies:
+        return None
+    return max(game.enemies, key=lambda enemy: enemy.rect.y).rect.centerx
+
+
+def _aim(game, tick):
+    """Persegue o inimigo mais baixo e atira quando está alinhado (no máximo a cada 6 ticks)."""
+    target = _lowest_enemy_x(game)
+    if target is None:
+        return Controls()
+    center = game.player.rect.centerx
+    # Alinhado = o tiro (que sai do centro do jogador) acerta o inimigo
+    aligned = abs(target - center) <= (ENEMY_SIZE[0] - BULLET_SIZE[0]) // 2
+    return Controls(left=target < center - PLAYER_SPEED, right=target > center + PLAYER_SPEED,
+                    fire=1 if aligned and tick % 6 == 0 else 0)
+
+
+_POLICY_FUNCS = {'idle': _idle, 'sweep': _sweep, 'aim': _aim}
+
+
+# --- Worker -------------------------------------------------------------------------
+
+def _init_worker(entity_backend):
+    global _game, _settings
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    # Sem isso o SDL transforma o SIGTERM em evento QUIT e Pool.terminate() nunca termina
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    from src.game import Game
+    _game = Game(headless=True, render=False, entity_backend=entity_backend,
+                 ranking=False, record_replays=False)
+    _settings = {}
+
+
+def _simulate(job):
+    """Roda uma partida e retorna um registro (ver RECORD_FIELDS)."""
+    global _settings
+    run_id, config_id, seed, settings, policy, max_ticks = job
+    game = _game
+    if settings != _settings:
+        game.configure(settings)
+        _settings = settings
+    bot = _POLICY_FUNCS[policy]
+
+    start = time.process_time()
+    game.start_game(seed)
+    update = game.update
+    tick = 0
+    while game.state == 'PLAYING' and tick < max_ticks:
+        update(bot(game, tick))
+        tick += 1
+    cpu = time.process_time() - start
+
+    survived = game.state == 'PLAYING'
+    game.state = 'MENU'
+    return (run_id, config_id, seed, game.score, tick, game.lives, survived, cpu)
+
+
+# --- Execução -----------------------------------------------------------------------
+
+def settings_grid(sweep: dict) -> list:
+    """
+    Expande {'ENEMY_SPEED': [3, 4], 'SPAWN_RATE': [40, 60]} em todas as combinações.
+    Sem varreduras, retorna uma única combinação vazia (os valores de src/config.py).
+    """
+    names = sorted(sweep)
+    return [dict(zip(names, values)) for values in itertools.product(*(sweep[n] for n in names))]
+
+
+def iter_jobs(configs: list, runs: int, base_seed: int, policy: str, max_ticks: int):
+    """Gera os jobs: runs partidas por combinação, com seeds base_seed, base_seed + 1, ..."""
+    run_id = 0
+    for config_id, settings in enumerate(configs):
+        for i in range(runs):
+            yield (run_id, config_id, base_seed + i, settings, policy, max_ticks)
+            run_id += 1
+
+
+def run_batch(configs: list, runs: int, base_seed: int = 0, policy: str = 'aim',
+              max_ticks: int = BATCH_MAX_TICKS, workers: int = None,
+              entity_backend: str = ENTITY_BACKEND, chunk_size: int = BATCH_CHUNK_SIZE):
+    """
+    Executa as partidas e gera os registros conforme ficam prontos (ordem não garantida).
+
+    As mesmas seeds são usadas em todas as combinações, então as diferenças entre
+    combinações vêm do balanceamento e não da sorte.
+    """
+    if policy not in _POLICY_FUNCS:
+        raise ValueError(f"Política desconhecida: {policy}")
+    workers = workers or os.cpu_count() or 1
+    jobs = iter_jobs(configs, runs, base_seed, policy, max_ticks)
+
+    if workers == 1:
+        _init_worker(entity_backend)
+        for job in jobs:
+            yield _simulate(job)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(entity_backend,)) as pool:
+        yield from pool.imap_unordered(_simulate, jobs, chunksize=chunk_size)
+        pool.close()
+        pool.join()
+
+
+class BatchSummary:
+    """Agrega os registros por combinação de configurações, sem guardar os registros inteiros."""
+
+    def __init__(self, configs: list, workers: int):
+        self.configs = configs
+        self.workers = workers
+        self._scores = [[] for _ in configs]
+        self._ticks = [0] * len(configs)
+        self._survived = [0] * len(configs)
+        self.total_ticks = 0
+        self.cpu_seconds = 0.0
+        self.runs = 0
+        self._start = time.perf_counter()
+        self.wall_seconds = 0.0
+
+    def add(self, record):
+        run_id, config_id, seed, score, ticks, lives, survived, cpu = record
+        self._scores[config_id].append(score)
+        self._ticks[config_id] += ticks
+        self._survived[config_id] += survived
+        self.total_ticks += ticks
+        self.cpu_seconds += cpu
+        self.runs += 1
+        self.wall_seconds = time.perf_counter() - self._start
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.total_ticks / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def ticks_per_sec_per_core(self) -> float:
+        """Ticks simulados por segundo de CPU de cada worker."""
+        return self.total_ticks / self.cpu_seconds if self.cpu_seconds else 0.0
+
+    def rows(self):
+        """Uma linha por combinação: (config, partidas, média, p50, p95, % sobrevivência, ticks médios)."""
+        for config_id, settings in enumerate(self.configs):
+            scores = sorted(self._scores[config_id])
+            n = len(scores)
+            if not n:
+                continue
+            yield (settings, n, statistics.fmean(scores), scores[n // 2],
+                   scores[min(n - 1, int(round(0.95 * (n - 1))))],
+                   self._survived[config_id] / n, self._ticks[config_id] / n)
@@ -0,0 +1,149 @@
+# src/bundle.py
+"""
+Pacote de assets pré-decodificados (gerado por bundle_tool.py).
+
+Um único arquivo com os pixels já redimensionados (RGBA/RGB crus) e os efeitos sonoros já em
+PCM no formato do mixer, precedidos por um índice:
+
+    b'DGBUNDLE' | versão (u32) | tamanho do índice (u32) | índice JSON | dados alinhados
+
+Em tempo de execução o arquivo é mapeado em memória (mmap) e as superfícies são criadas
+direto sobre o mapeamento, sem ler nem decodificar PNG/MP3. Cada entrada guarda o tamanho e a
+data do arquivo de origem: se o original mudou, ou se o tamanho/formato pedido não está no
+pacote, quem chama recebe None e volta a decodificar o arquivo original.
+"""
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from src.assets import SpriteCache
+from src.config import ASSETS_DIR
+
+MAGIC = b'DGBUNDLE'
+VERSION = 1
+_PREFIX = struct.Struct('<8sII')  # magic, versão, tamanho do índice
+_ALIGN = 64
+
+
+def _source_key(path: str) -> str:
+    return os.path.relpath(path, ASSETS_DIR).replace(os.sep, '/')
+
+
+def _image_key(image_path: str, size, alpha: bool) -> str:
+    return f"{_source_key(image_path)}@{size[0]}x{size[1]}{'a' if alpha else ''}"
+
+
+def _stamp(path: str) -> list:
+    """Identifica a versão de um arquivo de origem (tamanho, mtime em ns)."""
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+class AssetBundle:
+    """Pacote aberto: entrega superfícies e sons criados sobre o arquivo mapeado."""
+
+    def __init__(self, path: str, index: dict, data: mmap.mmap, base: int):
+        self.path = path
+        self._index = index
+        self._data = data
+        self._base = base
+        self._stamps = {}  # caminho de origem -> carimbo atual (um os.stat por arquivo)
+
+    @classmethod
+    def open(cls, path: str):
+        """Abre o pacote, ou retorna None se ele não existe ou é inválido."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_size = _PREFIX.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("formato desconhecido, gere o pacote de novo")
+            index = json.loads(data[_PREFIX.size:_PREFIX.size + index_size])
+        except Exception as e:
+            print(f"Pacote de assets ignorado ({os.path.basename(path)}): {e}")
+            return None
+        return cls(path, index, data, _PREFIX.size + index_size)
+
+    def _fresh(self, entry: dict, source: str) -> bool:
+        if source not in self._stamps:
+            try:
+                self._stamps[source] = _stamp(source)
+            except OSError:
+                self._stamps[source] = None
+        return entry['stamp'] == self._stamps[source]
+
+    def _view(self, entry: dict) -> memoryview:
+        start = self._base + entry['offset']
+        return memoryview(self._data)[start:start + entry['length']]
+
+    def image(self, image_path: str, size: tuple, alpha: bool = True):
+        """
+        Superfície (ainda não convertida, como SpriteCache.decode) apontando para o pacote,
+        ou None se a imagem não está no pacote nesse tamanho ou o PNG mudou desde a geração.
+        """
+        entry = self._index['images'].get(_image_key(image_path, size, alpha))
+        if entry is None or not self._fresh(entry, image_path):
+            return None
+        return pygame.image.frombuffer(self._view(entry), tuple(size), entry['format'])
+
+    def sound(self, sound_path: str):
+        """
+        Som criado a partir do PCM do pacote, ou None se ele não está no pacote, o arquivo
+        mudou ou o mixer foi aberto em outro formato (frequência, amostra, canais).
+        """
+        entry = self._index['sounds'].get(_source_key(sound_path))
+        if entry is None or not self._fresh(entry, sound_path):
+            return None
+        if list(pygame.mixer.get_init() or ()) != self._index['mixer']:
+            return None
+        return pygame.mixer.Sound(buffer=self._view(entry))
+
+    def __len__(self):
+        return len(self._index['images']) + len(self._index['sounds'])
+
+
+def build_bundle(path: str, images, sounds) -> dict:
+    """
+    Gera o pacote em path a partir de (caminho, tamanho, alpha) das imagens e dos caminhos
+    dos sons. Requer pygame.init() e, para os sons, o mixer aberto no formato que o jogo usa.
+    Retorna o índice gravado.
+    """
+    index = {'images': {}, 'sounds': {}, 'mixer': list(pygame.mixer.get_init() or ())}
+    blobs = []
+    offset = 0
+
+    def add(table, key, source, raw, **extra):
+        nonlocal offset
+        padding = -offset % _ALIGN
+        blobs.append(b'\0' * padding + raw)
+        offset += padding
+        table[key] = dict(offset=offset, length=len(raw), stamp=_stamp(source), **extra)
+        offset += len(raw)
+
+    for image_path, size, alpha in images:
+        fmt = 'RGBA' if alpha else 'RGB'
+        surface = SpriteCache.decode(image_path, size)
+        add(index['images'], _image_key(image_path, size, alpha), image_path,
+            pygame.image.tobytes(surface, fmt), format=fmt)
+
+    if sounds and not index['mixer']:
+        raise RuntimeError("mixer não inicializado: os sons não podem ser convertidos para PCM")
+    for sound_path in sounds:
+        add(index['sounds'], _source_key(sound_path), sound_path, pygame.mixer.Sound(sound_path).get_raw())
+
+    header = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-(_PREFIX.size + len(header)) % _ALIGN)  # Dados começam alinhados
+    # Grava em um arquivo temporário e troca de uma vez: um jogo aberto nunca vê o pacote pela metade
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return index
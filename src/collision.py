@@ -0,0 +1,161 @@
+# src/collision.py
+"""
+Detecção de colisões entre tiros, inimigos e jogador.
+Oferece a busca por força bruta original e uma fase ampla com hash espacial (grade uniforme).
+"""
+from src.config import COLLISION_CELL_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependência opcional
+    np = None
+
+
+def brute_force_pairs(bullets, enemies):
+    """
+    Compara cada tiro com cada inimigo (O(tiros × inimigos)).
+
+    Returns:
+        Lista de pares (índice do tiro, índice do inimigo) que colidem,
+        na mesma ordem do laço original.
+    """
+    enemy_rects = [enemy.rect for enemy in enemies]
+    pairs = []
+    for b_idx, bullet in enumerate(bullets):
+        bullet_rect = bullet.rect
+        for e_idx, enemy_rect in enumerate(enemy_rects):
+            if bullet_rect.colliderect(enemy_rect):
+                pairs.append((b_idx, e_idx))
+    return pairs
+
+
+class SpatialHash:
+    """
+    Grade uniforme que mapeia células para os índices dos retângulos que as tocam.
+    Reconstruída a cada tick: inserir é O(n) e cada consulta só olha as células vizinhas.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self._cell_size = cell_size
+        self._cells = {}
+        self._rects = []
+
+    def clear(self):
+        self._cells.clear()
+        self._rects = []
+
+    def _cell_range(self, rect):
+        size = self._cell_size
+        # right/bottom são exclusivos, por isso o -1 (mesma regra do colliderect)
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def build(self, rects):
+        """Reconstrói a grade a partir de uma lista de retângulos."""
+        self.clear()
+        self._rects = rects
+        cells = self._cells
+        for idx, rect in enumerate(rects):
+            x0, x1, y0, y1 = self._cell_range(rect)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [idx]
+                    else:
+                        bucket.append(idx)
+
+    def query(self, rect):
+        """Retorna, em ordem crescente, os índices dos retângulos que colidem com rect."""
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            candidates = cells.get((x0, y0), ())
+        else:
+            candidates = set()
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        candidates.update(bucket)
+        rects = self._rects
+        return sorted(idx for idx in candidates if rect.colliderect(rects[idx]))
+
+
+def spatial_hash_pairs(bullets, enemies, grid: SpatialHash):
+    """Mesmo resultado de brute_force_pairs, usando a grade como fase ampla."""
+    grid.build([enemy.rect for enemy in enemies])
+    pairs = []
+    for b_idx, bullet in enumerate(bullets):
+        for e_idx in grid.query(bullet.rect):
+            pairs.append((b_idx, e_idx))
+    return pairs
+
+
+# --- Versões vetorizadas para o armazenamento em arrays (src/entities/store.py) ---
+
+def _overlap_1d(a_pos, a_size, b_pos, b_size):
+    """Mesma regra do colliderect num eixo: intervalos semiabertos que se cruzam."""
+    return (a_pos < b_pos + b_size) & (b_pos < a_pos + a_size)
+
+
+def array_brute_force_pairs(bullets, enemies, chunk=4096):
+    """
+    Testa todos os tiros contra todos os inimigos por broadcasting (em blocos, para limitar memória).
+
+    Returns:
+        Dois arrays (índices dos tiros, índices dos inimigos), ordenados como o laço original.
+    """
+    bx, by = bullets.xs, bullets.ys
+    ex, ey = enemies.xs, enemies.ys
+    b_parts, e_parts = [], []
+    for start in range(0, len(bx), chunk):
+        cx = bx[start:start + chunk, None]
+        cy = by[start:start + chunk, None]
+        hit = (_overlap_1d(cx, bullets.width, ex[None, :], enemies.width)
+               & _overlap_1d(cy, bullets.height, ey[None, :], enemies.height))
+        b_idx, e_idx = np.nonzero(hit)
+        b_parts.append(b_idx + start)
+        e_parts.append(e_idx)
+    if not b_parts:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(b_parts), np.concatenate(e_parts)
+
+
+def array_sweep_pairs(bullets, enemies):
+    """
+    Fase ampla por ordenação no eixo X (sweep and prune): cada tiro só é testado contra
+    os inimigos cujo intervalo em X pode cruzar o seu. Resultado idêntico a array_brute_force_pairs.
+    """
+    bx, by = bullets.xs, bullets.ys
+    ex, ey = enemies.xs, enemies.ys
+    if len(bx) == 0 or len(ex) == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    order = np.argsort(ex, kind='stable')
+    sorted_x = ex[order]
+    # Inimigos com ex em (bx - largura_inimigo, bx + largura_tiro) podem colidir
+    lo = np.searchsorted(sorted_x, bx - enemies.width, side='right')
+    hi = np.searchsorted(sorted_x, bx + bullets.width, side='left')
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    b_idx = np.repeat(np.arange(len(bx)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    e_idx = order[np.repeat(lo, counts) + offsets]
+
+    hit = _overlap_1d(by[b_idx], bullets.height, ey[e_idx], enemies.height)
+    b_idx, e_idx = b_idx[hit], e_idx[hit]
+    ordering = np.lexsort((e_idx, b_idx))
+    return b_idx[ordering], e_idx[ordering]
+
+
+def array_hits_rect(store, rect):
+    """Retorna True se alguma entidade do armazenamento colide com o retângulo."""
+    return bool(np.any(_overlap_1d(store.xs, store.width, rect.x, rect.width)
+                       & _overlap_1d(store.ys, store.height, rect.y, rect.height)))
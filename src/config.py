@@ -7,12 +7,35 @@ ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
 DB_PATH = os.path.join(os.path.dirname(__file__), 'ranking.db')
 MAX_RANKING_ENTRIES = 10
 MAX_NAME_LENGTH = 10
+RANKING_ASYNC_WRITES = True  # Grava pontuações em uma thread separada do loop do jogo
+RANKING_SYNCHRONOUS = 'NORMAL'  # PRAGMA synchronous do SQLite: 'OFF', 'NORMAL', 'FULL' ou 'EXTRA'
+RANKING_KEEP_ENTRIES = 100  # Histórico mantido pela limpeza a cada inserção (modo padrão)
+# Modo leaderboard: histórico completo, posições via tabela de contagem por score
+# e retenção feita em lotes periódicos em vez de a cada inserção
+RANKING_LEADERBOARD_MODE = False
+RANKING_RETENTION_ENTRIES = None  # None = guarda tudo; N = retenção mantém as N melhores
+RANKING_RETENTION_INTERVAL = 1000  # Inserções entre execuções automáticas da retenção
+RANKING_RETENTION_BATCH = 5000  # Máximo de linhas apagadas por lote
+RANKING_IMPORT_BATCH = 10000  # Linhas por transação na importação/exportação em massa
+# Vários processos/gabinetes usando o mesmo DB_PATH
+RANKING_SHARED = False  # Revalida a cópia em memória quando outro processo grava
+RANKING_SHARED_CHECK_INTERVAL = 1.0  # Segundos entre revalidações durante a exibição do ranking
+RANKING_BUSY_TIMEOUT = 5.0  # Segundos que o SQLite espera por um lock antes de desistir
+RANKING_MAX_RETRIES = 8  # Novas tentativas (com backoff) quando o banco continua ocupado
+RANKING_RETRY_BASE_DELAY = 0.01  # Espera inicial (s) do backoff exponencial
+RANKING_COALESCE_WRITES = 64  # Máximo de gravações enfileiradas agrupadas em uma transação
 
 # Dimensões da Tela
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Laço principal: a simulação avança em passos fixos, independente da taxa de renderização
+SIMULATION_RATE = FPS  # Ticks de simulação por segundo (velocidades e SPAWN_RATE são por tick)
+RENDER_FPS_LIMIT = FPS  # Máximo de frames desenhados por segundo (0 = sem limite)
+MAX_TICKS_PER_FRAME = 5  # Ticks recuperados por frame quando o jogo atrasa; o resto é descartado
+VSYNC = False  # Sincroniza a apresentação com o monitor (quando o driver de vídeo suporta)
+
 # Cores (R, G, B)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -34,8 +57,64 @@ PLAYER_LIVES = 3  # Vidas iniciais
 # Configurações do Inimigo
 ENEMY_SPEED = 3
 ENEMY_SIZE = (40, 40)
-SPAWN_RATE = 60 # A cada 60 frames (1 seg), nasce um inimigo
+SPAWN_RATE = 60 # A cada 60 ticks (1 seg), nasce um inimigo
 
 # Configurações do Tiro
 BULLET_SPEED = 7
-BULLET_SIZE = (5, 10)
\ No newline at end of file
+BULLET_SIZE = (5, 10)
+
+# Configurações de Colisão
+# 'grid' = hash espacial, 'brute' = força bruta, 'compare' = roda os dois e confere os resultados
+COLLISION_MODE = 'grid'
+COLLISION_CELL_SIZE = 64  # Tamanho (px) de cada célula da grade
+
+# Renderização
+# 'full' = redesenha a tela inteira a cada frame
+# 'dirty' = restaura só as áreas alteradas e usa pygame.display.update(retângulos)
+RENDER_MODE = 'full'
+# Resolução interna (ver src/render.py): o jogo desenha em RENDER_* e o frame é escalado
+# uma vez para a janela WINDOW_*. A simulação continua em SCREEN_WIDTH x SCREEN_HEIGHT.
+RENDER_WIDTH = SCREEN_WIDTH
+RENDER_HEIGHT = SCREEN_HEIGHT
+WINDOW_WIDTH = RENDER_WIDTH
+WINDOW_HEIGHT = RENDER_HEIGHT
+RENDER_SCALING = 'nearest'  # 'nearest' = escala inteira sem suavização, 'smooth' = suavizada
+# Desenha inimigos e tiros com um único Surface.blits por frame em vez de um blit por entidade
+SPRITE_BATCHING = True
+
+# Quantidade máxima de textos renderizados mantidos em cache
+TEXT_CACHE_SIZE = 128
+
+# Inicialização
+ASYNC_ASSET_LOADING = True  # Mostra o MENU logo e carrega sons, fontes e imagens em segundo plano
+STARTUP_REPORT = False  # Imprime o tempo de cada etapa até o primeiro frame
+# Pacote com sprites e sons já decodificados (gerado por bundle_tool.py); sem ele, ou se estiver
+# desatualizado, os PNG/MP3 são decodificados como antes
+ASSET_BUNDLE = True
+ASSET_BUNDLE_PATH = os.path.join(ASSETS_DIR, 'assets.bundle')
+
+# Efeitos sonoros (ver src/audio.py)
+# Canais reservados e prioridade de cada categoria; pedidos iguais no mesmo tick viram uma voz só
+SFX_CHANNELS = {'explosion': (4, 2), 'shoot': (3, 1)}
+SFX_STEAL_AFTER = 6  # Ticks até uma voz poder ser interrompida por outra de mesma prioridade
+
+# Profiler de frames (F3 liga/desliga o overlay, F4 exporta o trace)
+PROFILER_ENABLED = False
+PROFILER_FRAMES = 600  # Frames mantidos no buffer circular (10 s a 60 FPS)
+PROFILER_TRACE_PATH = 'profile_trace.json'
+
+# Replays (ver src/replay.py)
+REPLAY_RECORD = False  # Grava cada partida (seed + comandos por tick) em REPLAY_DIR
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'replays')
+
+# Balanceamento que pode ser sobrescrito por partida (Game(settings=...), batch_tool.py)
+TUNABLE_SETTINGS = ('ENEMY_SPEED', 'SPAWN_RATE', 'BULLET_SPEED', 'PLAYER_LIVES')
+BATCH_MAX_TICKS = 18000  # Limite de uma partida simulada em lote (5 min de jogo)
+BATCH_CHUNK_SIZE = 16  # Partidas enviadas por vez a cada processo
+
+# Armazenamento das entidades
+# 'objects' = listas de Enemy/Bullet, 'arrays' = arrays NumPy (requer numpy)
+ENTITY_BACKEND = 'objects'
+# Capacidade dos pools de reaproveitamento (backend 'objects')
+ENEMY_POOL_SIZE = 64
+BULLET_POOL_SIZE = 256
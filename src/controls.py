@@ -0,0 +1,32 @@
+# src/controls.py
+"""
+Comandos do jogador em um único tick.
+Separa a leitura do teclado da lógica do jogo, permitindo simular partidas sem janela.
+"""
+import pygame
+
+
+class Controls:
+    """
+    Estado das entradas de um tick: esquerda, direita e quantidade de tiros disparados.
+    """
+    __slots__ = ('left', 'right', 'fire')
+
+    def __init__(self, left: bool = False, right: bool = False, fire: int = 0):
+        self.left = bool(left)
+        self.right = bool(right)
+        self.fire = int(fire)
+
+    @classmethod
+    def from_keyboard(cls, fire: int = 0) -> 'Controls':
+        """Lê as setas pressionadas no momento; os tiros vêm dos eventos KEYDOWN."""
+        keys = pygame.key.get_pressed()
+        return cls(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], fire)
+
+    def __eq__(self, other):
+        if not isinstance(other, Controls):
+            return NotImplemented
+        return (self.left, self.right, self.fire) == (other.left, other.right, other.fire)
+
+    def __repr__(self):
+        return f"Controls(left={self.left}, right={self.right}, fire={self.fire})"
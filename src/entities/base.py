@@ -1,6 +1,8 @@
 # src/entities/base.py
 import pygame
 from abc import ABC, abstractmethod
+from src.assets import sprite_cache
+from src.render import SCALED, to_render, render_size
 
 
 class Entity(ABC):
@@ -12,13 +14,16 @@ class Entity(ABC):
         # Encapsulamento: Atributos protegidos com _
         self._x = x
         self._y = y
+        # Posição no tick anterior, para interpolar o desenho entre dois ticks
+        self._prev_x = x
+        self._prev_y = y
         self._width = width
         self._height = height
         self._is_active = True
 
         if image_path:
-            self._image = pygame.image.load(image_path).convert_alpha()
-            self._image = pygame.transform.scale(self._image, (width, height))
+            # Superfície compartilhada entre todas as entidades do mesmo tipo, já na resolução interna
+            self._image = sprite_cache.get(image_path, render_size((width, height)))
         else:
             self._image = None
         
@@ -31,6 +36,21 @@ class Entity(ABC):
         self._rect.topleft = (self._x, self._y)
         return self._rect
 
+    @property
+    def image(self):
+        """Superfície compartilhada do sprite (None se a imagem não carregou)."""
+        return self._image
+
+    def set_position(self, x, y):
+        self._x = self._prev_x = x
+        self._y = self._prev_y = y
+
+    def reset(self, x, y):
+        """Reativa a entidade em uma nova posição (usado pelos pools)."""
+        self._x = self._prev_x = x
+        self._y = self._prev_y = y
+        self._is_active = True
+
     @property
     def is_active(self):
         return self._is_active
@@ -42,8 +62,48 @@ class Entity(ABC):
     def update(self):
         pass
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        """
+        Desenha a entidade e retorna a área da tela alterada.
+
+        Args:
+            alpha: Fração (0 a 1) do caminho entre a posição do tick anterior e a atual
+        """
+        if alpha >= 1.0:
+            x, y = self._x, self._y
+        else:
+            x = round(self._prev_x + (self._x - self._prev_x) * alpha)
+            y = round(self._prev_y + (self._y - self._prev_y) * alpha)
+        if SCALED:
+            x, y = to_render(x, y)
         if self._image:
-            surface.blit(self._image, (self._x, self._y))
+            return surface.blit(self._image, (x, y))
         else:
-            pygame.draw.rect(surface, (255, 255, 255), self.rect)
\ No newline at end of file
+            size = render_size((self._width, self._height)) if SCALED else (self._width, self._height)
+            return pygame.draw.rect(surface, (255, 255, 255), ((x, y), size))
+
+    @staticmethod
+    def blit_sequence(entities, alpha=1.0):
+        """
+        Monta a sequência (superfície, posição) de uma lista de entidades para um único
+        Surface.blits, em vez de um Entity.draw por entidade.
+
+        Returns:
+            (sequência, entidades sem imagem, que devem ser desenhadas com draw)
+        """
+        sequence = []
+        fallback = []
+        append = sequence.append
+        for entity in entities:
+            image = entity._image
+            if image is None:
+                fallback.append(entity)
+            elif alpha >= 1.0:
+                append((image, (entity._x, entity._y)))
+            else:
+                prev_x, prev_y = entity._prev_x, entity._prev_y
+                append((image, (round(prev_x + (entity._x - prev_x) * alpha),
+                                round(prev_y + (entity._y - prev_y) * alpha))))
+        if SCALED:
+            sequence = [(image, to_render(*position)) for image, position in sequence]
+        return sequence, fallback
\ No newline at end of file
@@ -4,11 +4,12 @@ from src.entities.base import Entity
 
 
 class Bullet(Entity):
-    def __init__(self, x, y):
+    def __init__(self, x, y, speed=BULLET_SPEED):
         super().__init__(x, y, BULLET_SIZE[0], BULLET_SIZE[1], image_path=BULLET_IMAGE)
-        self._speed = BULLET_SPEED
+        self._speed = speed
 
     def update(self):
+        self._prev_y = self._y
         self._y -= self._speed
 
         if self._y < 0:
@@ -3,17 +3,22 @@ from src.entities.base import Entity
 
 
 class Enemy(Entity):
-    def __init__(self, x, y):
+    def __init__(self, x, y, speed=ENEMY_SPEED):
         super().__init__(x, y, ENEMY_SIZE[0], ENEMY_SIZE[1], image_path=ENEMY_IMAGE)
-        self._speed = ENEMY_SPEED
+        self._speed = speed
         self._escaped = False  # Flag para indicar se o inimigo escapou
 
+    def reset(self, x, y):
+        super().reset(x, y)
+        self._escaped = False
+
     @property
     def escaped(self):
         """Retorna True se o inimigo escapou (passou da tela)."""
         return self._escaped
 
     def update(self):
+        self._prev_y = self._y
         self._y += self._speed
 
         if self._y > SCREEN_HEIGHT:
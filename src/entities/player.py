@@ -1,6 +1,6 @@
 # src/entities/player.py
-import pygame
 from src.config import *
+from src.controls import Controls
 from src.entities.base import Entity
 
 
@@ -16,12 +16,15 @@ class Player(Entity):
         )
         self._speed = PLAYER_SPEED
 
-    def update(self):
-        keys = pygame.key.get_pressed()
+    def update(self, controls: Controls = None):
+        # As entradas chegam prontas (teclado, replay ou simulação); sem comandos, fica parado
+        self._prev_x = self._x
+        if controls is None:
+            return
 
-        if keys[pygame.K_LEFT] and self._x > 0:
+        if controls.left and self._x > 0:
             self._x -= self._speed
-        if keys[pygame.K_RIGHT] and self._x < SCREEN_WIDTH - self._width:
+        if controls.right and self._x < SCREEN_WIDTH - self._width:
             self._x += self._speed
 
     def move_up(self):
@@ -0,0 +1,91 @@
+# src/entities/pool.py
+"""
+Pool de entidades reaproveitáveis.
+Inimigos e tiros destruídos voltam para o pool e são reiniciados com reset(),
+evitando criar objetos (e Rects) novos a cada tiro ou nascimento.
+"""
+
+
+class EntityPool:
+    """
+    Pool de capacidade fixa para um tipo de entidade.
+    Demonstra: Encapsulamento e reaproveitamento de objetos.
+    """
+
+    def __init__(self, factory, capacity: int):
+        """
+        Args:
+            factory: Classe (ou função) que cria a entidade a partir de (x, y)
+            capacity: Quantidade máxima de entidades livres guardadas para reuso
+        """
+        self._factory = factory
+        self._capacity = capacity
+        self._free = []
+        self._in_use = 0
+        self._high_water = 0
+        self._created = 0
+        self._reused = 0
+
+    def warm(self, count: int = None):
+        """Cria antecipadamente entidades livres (por padrão, até a capacidade)."""
+        count = self._capacity if count is None else min(count, self._capacity)
+        while len(self._free) < count:
+            entity = self._factory(0, 0)
+            entity.destroy()
+            self._free.append(entity)
+            self._created += 1
+
+    def acquire(self, x, y):
+        """Retorna uma entidade ativa na posição (x, y), reaproveitando uma livre se houver."""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(x, y)
+            self._reused += 1
+        else:
+            entity = self._factory(x, y)
+            self._created += 1
+
+        self._in_use += 1
+        if self._in_use > self._high_water:
+            self._high_water = self._in_use
+        return entity
+
+    def release(self, entity):
+        """Devolve uma entidade ao pool (descartada se o pool já estiver cheio)."""
+        self._in_use -= 1
+        if len(self._free) < self._capacity:
+            self._free.append(entity)
+
+    def release_all(self, entities: list):
+        """Devolve todas as entidades da lista e a esvazia."""
+        for entity in entities:
+            self.release(entity)
+        entities.clear()
+
+    def compact(self, entities: list):
+        """
+        Remove as entidades inativas da lista no próprio lugar (swap-remove),
+        devolvendo-as ao pool. A ordem das entidades restantes pode mudar.
+        """
+        i = 0
+        n = len(entities)
+        while i < n:
+            entity = entities[i]
+            if entity.is_active:
+                i += 1
+            else:
+                n -= 1
+                entities[i] = entities[n]
+                self.release(entity)
+        del entities[n:]
+
+    def stats(self) -> dict:
+        """Ocupação atual e contadores do pool."""
+        return {
+            'capacity': self._capacity,
+            'in_use': self._in_use,
+            'free': len(self._free),
+            'high_water': self._high_water,
+            'created': self._created,
+            'reused': self._reused,
+        }
@@ -0,0 +1,173 @@
+# src/entities/store.py
+"""
+Armazenamento vetorizado (struct-of-arrays) para inimigos e tiros.
+Cada atributo fica em um array NumPy; movimento, descarte e fuga viram operações em lote.
+O NumPy é opcional: sem ele, o jogo continua usando listas de objetos.
+"""
+from abc import ABC, abstractmethod
+
+from src.config import *
+from src.entities.enemy import Enemy
+from src.entities.bullet import Bullet
+from src.render import SCALED, SCALE_X, SCALE_Y
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependência opcional
+    np = None
+
+
+class EntityArrays(ABC):
+    """
+    Coleção de entidades de um mesmo tipo guardada em arrays paralelos.
+    Demonstra: Encapsulamento (os arrays só crescem/compactam por aqui).
+    """
+    # Classe usada como "visão" leve para desenhar cada linha
+    view_class = None
+    # Sentido do movimento vertical (+1 desce, -1 sobe), usado na interpolação do desenho
+    direction = 0
+
+    def __init__(self, width, height, speed, capacity=256):
+        if np is None:
+            raise ImportError("NumPy é necessário para o armazenamento vetorizado")
+        self.width = width
+        self.height = height
+        self._default_speed = speed
+        self._count = 0
+        self._allocate(capacity)
+        self._view = None
+
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.escaped = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        old = (self.x, self.y, self.speed, self.active, self.escaped)
+        self._allocate(len(self.x) * 2)
+        n = self._count
+        for new, prev in zip((self.x, self.y, self.speed, self.active, self.escaped), old):
+            new[:n] = prev[:n]
+
+    def __len__(self):
+        return self._count
+
+    def spawn(self, x, y, speed=None):
+        """Adiciona uma entidade ativa na posição (x, y)."""
+        if self._count == len(self.x):
+            self._grow()
+        i = self._count
+        self.x[i] = x
+        self.y[i] = y
+        self.speed[i] = self._default_speed if speed is None else speed
+        self.active[i] = True
+        self.escaped[i] = False
+        self._count += 1
+
+    def destroy(self, indices):
+        """Desativa as entidades dos índices dados."""
+        self.active[indices] = False
+
+    def compact(self):
+        """Remove as entidades inativas, preservando a ordem das restantes."""
+        n = self._count
+        keep = np.flatnonzero(self.active[:n])
+        if len(keep) == n:
+            return
+        m = len(keep)
+        for arr in (self.x, self.y, self.speed, self.active, self.escaped):
+            arr[:m] = arr[keep]
+        self._count = m
+
+    def clear(self):
+        self._count = 0
+
+    # Fatias apenas das linhas em uso
+    @property
+    def xs(self):
+        return self.x[:self._count]
+
+    @property
+    def ys(self):
+        return self.y[:self._count]
+
+    def escaped_count(self) -> int:
+        """Quantas entidades estão marcadas como fugitivas."""
+        return int(np.count_nonzero(self.escaped[:self._count]))
+
+    @abstractmethod
+    def update(self):
+        pass
+
+    def views(self, alpha=1.0):
+        """
+        Percorre as entidades como uma única instância de Enemy/Bullet reposicionada (flyweight),
+        para que o desenho use o mesmo Entity.draw das listas de objetos.
+
+        Args:
+            alpha: Interpolação entre o tick anterior e o atual; como a velocidade é constante,
+                a posição anterior é a atual menos um passo
+        """
+        if self._view is None:
+            self._view = self.view_class(0, 0)
+        view = self._view
+        for x, y in zip(self.xs.tolist(), self._draw_ys(alpha).tolist()):
+            view.set_position(x, y)
+            yield view
+
+    def _draw_ys(self, alpha):
+        """Coordenadas y para desenho, interpoladas entre o tick anterior e o atual."""
+        if alpha >= 1.0:
+            return self.ys
+        n = self._count
+        return np.rint(self.ys - self.direction * self.speed[:n] * (1.0 - alpha)).astype(np.int32)
+
+    def blit_sequence(self, alpha=1.0):
+        """
+        Mesma interface de Entity.blit_sequence: todas as linhas compartilham a superfície
+        do tipo; sem imagem, tudo vai para o desenho individual pelas visões.
+        """
+        if self._view is None:
+            self._view = self.view_class(0, 0)
+        image = self._view.image
+        if image is None:
+            return [], self.views(alpha)
+        xs, ys = self.xs, self._draw_ys(alpha)
+        if SCALED:
+            xs = np.rint(xs * SCALE_X).astype(np.int32)
+            ys = np.rint(ys * SCALE_Y).astype(np.int32)
+        return [(image, position) for position in zip(xs.tolist(), ys.tolist())], ()
+
+
+class EnemyArrays(EntityArrays):
+    view_class = Enemy
+    direction = 1
+
+    def __init__(self, capacity=256, speed=ENEMY_SPEED):
+        super().__init__(ENEMY_SIZE[0], ENEMY_SIZE[1], speed, capacity)
+
+    def update(self):
+        """Desce todos os inimigos e marca como fugitivos os que passaram da tela."""
+        n = self._count
+        y = self.y[:n]
+        y += self.speed[:n]
+        fled = y > SCREEN_HEIGHT
+        self.escaped[:n] |= fled
+        self.active[:n] &= ~fled
+
+
+class BulletArrays(EntityArrays):
+    view_class = Bullet
+    direction = -1
+
+    def __init__(self, capacity=256, speed=BULLET_SPEED):
+        super().__init__(BULLET_SIZE[0], BULLET_SIZE[1], speed, capacity)
+
+    def update(self):
+        """Sobe todos os tiros e desativa os que saíram pelo topo."""
+        n = self._count
+        y = self.y[:n]
+        y -= self.speed[:n]
+        self.active[:n] &= ~(y < 0)
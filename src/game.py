@@ -1,102 +1,321 @@
 import pygame
 import random
 import os
+import time
+from functools import partial
+import src.config as config
 from src.config import *
 from src.entities.player import Player
 from src.entities.enemy import Enemy
 from src.entities.bullet import Bullet
+from src.entities.base import Entity
 from src.ranking import RankingDB
+from src.assets import sprite_cache
+from src.collision import (SpatialHash, brute_force_pairs, spatial_hash_pairs,
+                           array_brute_force_pairs, array_sweep_pairs, array_hits_rect)
+from src.entities import store
+from src.entities.pool import EntityPool
+from src.controls import Controls
+from src.text_cache import TextCache
+from src.profiler import FrameProfiler
+from src.replay import ReplayRecorder
+from src.loader import AssetLoader, StartupReport
+from src.audio import VoiceManager
+from src.render import Presenter, SCALE_Y, to_render, render_size, font_size
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-
-        pygame.display.set_caption("Defensor Galáctico")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, collision_mode=COLLISION_MODE, headless=False, render=None,
+                 entity_backend=ENTITY_BACKEND, render_mode=RENDER_MODE,
+                 profile=PROFILER_ENABLED, ranking=True, record_replays=REPLAY_RECORD, settings=None,
+                 async_assets=ASYNC_ASSET_LOADING):
+        # Modo headless: sem janela nem placa de som reais, sem limite de FPS.
+        # A simulação é conduzida por step(); draw() só roda se render=True.
+        self.headless = headless
+        self.render = (not headless) if render is None else render
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        # Inicialização mínima para mostrar o MENU; áudio, fontes e imagens vêm do AssetLoader
+        self.startup = StartupReport()
+        with self.startup.step('pygame.init'):
+            pygame.init()
+        with self.startup.step('janela'):
+            pygame.display.set_caption("Defensor Galáctico")
+            # self.screen é onde o jogo desenha: a própria janela ou a superfície da resolução interna
+            self.presenter = Presenter((WINDOW_WIDTH, WINDOW_HEIGHT), (RENDER_WIDTH, RENDER_HEIGHT),
+                                       RENDER_SCALING, vsync=VSYNC and not headless)
+            self.screen = self.presenter.surface
         self.clock = pygame.time.Clock()
         self.running = True
-        self.font = pygame.font.SysFont("Arial", 24)
-        self.font_big = pygame.font.SysFont("Arial", 48)
+        # Fonte embutida do pygame (sem varrer as fontes do sistema) até as definitivas chegarem
+        with self.startup.step('fonte padrão'):
+            self.font = pygame.font.Font(None, font_size(24))
+            self.font_big = pygame.font.Font(None, font_size(48))
+            self.font_small = pygame.font.Font(None, font_size(14))
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        self._hud = None  # (score, vidas, superfície do score, superfície das vidas)
 
         self.state = 'MENU'
-        # Caminho para os arquivos de som
-        base_path = os.path.dirname(__file__)
-        assets_path = os.path.join(base_path, 'assets')
-
-        try:
-            # Efeitos Sonoros (SFX)
-            self.sfx_shoot = pygame.mixer.Sound(os.path.join(assets_path, 'shoot.mp3'))
-            self.sfx_explosion = pygame.mixer.Sound(os.path.join(assets_path, 'explosion.mp3'))
-
-            # Ajuste de volume (0.0 a 1.0)
-            self.sfx_shoot.set_volume(0.3)
-            self.sfx_explosion.set_volume(0.5)
-
-            # Música de Fundo
-            pygame.mixer.music.load(os.path.join(assets_path, 'background.mp3'))
-            pygame.mixer.music.set_volume(0.2)  # Música mais baixa para não atrapalhar
-            pygame.mixer.music.play(-1)  # O '-1' faz a música repetir para sempre (loop)
-
-        except Exception as e:
-            print(f"Erro ao carregar sons: {e}")
-            print("O jogo continuará sem som.")
-            # Cria sons vazios para o jogo não travar se o arquivo faltar
-            self.sfx_shoot = None
-            self.sfx_explosion = None
-
-        # Carrega a imagem de background
-        try:
-            self.background = pygame.image.load(BACKGROUND_IMAGE).convert()
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except Exception as e:
-            print(f"Erro ao carregar background: {e}")
-            self.background = None
-
-        # Inicializa o sistema de ranking
-        try:
-            self.ranking_db = RankingDB()
-        except Exception as e:
-            print(f"Erro ao inicializar ranking: {e}")
-            self.ranking_db = None
+        # Sons vazios e fundo preto até o carregamento terminar (ou se os arquivos faltarem)
+        self.sfx_shoot = None
+        self.sfx_explosion = None
+        # Os efeitos sonoros tocam pelo gerenciador de vozes (ver src/audio.py)
+        self.voices = VoiceManager()
+        self.background = None
+        self.assets = AssetLoader(self.startup, ASSET_BUNDLE_PATH if ASSET_BUNDLE else None)
+        self.assets_ready = False
+        self._start_requested = False
+        self._report_pending = STARTUP_REPORT and not headless
+        # Headless carrega tudo na hora: simulações não têm menu para esconder a espera
+        self.async_assets = async_assets and not headless
+        if self.async_assets:
+            self.assets.start()
+
+        # Inicializa o sistema de ranking (ranking=False para simulações e replays)
+        self.ranking_db = None
+        if ranking:
+            try:
+                with self.startup.step('ranking'):
+                    self.ranking_db = RankingDB(async_writes=RANKING_ASYNC_WRITES)
+            except Exception as e:
+                print(f"Erro ao inicializar ranking: {e}")
+
+        # Detecção de colisões (ver src/collision.py)
+        self.collision_mode = collision_mode
+        self.collision_grid = SpatialHash()
+        self.collision_mismatches = 0
+
+        # Armazenamento de inimigos/tiros: listas de objetos ou arrays NumPy (ver src/entities/store.py)
+        if entity_backend == 'arrays' and store.np is None:
+            print("NumPy não encontrado; usando listas de objetos.")
+            entity_backend = 'objects'
+        self.entity_backend = entity_backend
+        self.configure(settings)
+        self._apply_settings()
+
+        # Renderização por retângulos sujos (ver _draw_dirty) e desenho em lote (ver _draw_batched)
+        self.render_mode = render_mode
+        self.sprite_batching = SPRITE_BATCHING
+        self._dirty_rects = []
+        self._frame_signature = None
+
+        # Profiler de frames: None quando desligado, custando só um teste por fase
+        self.profiler = FrameProfiler(PROFILER_FRAMES, 1000 / FPS) if profile else None
+        self.show_overlay = False
+
+        # Aleatoriedade da partida: gerador próprio com seed, para que a partida seja reproduzível
+        self.rng = random.Random()
+        self.seed = None
+        self.record_replays = record_replays
+        self.recorder = None
+
+        # Passo fixo da simulação (ver _advance); draw interpola as posições pela fração restante
+        self._tick_ns = 1_000_000_000 // SIMULATION_RATE
+        self._accumulator = 0
+        self._last_frame_ns = None
+        self.interpolation = 1.0
+        self.skipped_ticks = 0
 
         # Variáveis para entrada de nome
         self.player_name = ""
         self.is_new_high_score = False
 
-        self.init_game_objects()
+        if self.async_assets:
+            # As entidades são criadas em _apply_assets, depois que os sprites chegam
+            self.enemies, self.bullets = [], []
+            self.score = 0
+            self.lives = self.player_lives
+            self.frame_count = 0
+            self._pending_shots = 0
+        else:
+            self.assets.load()
+            self._apply_assets()
+
+    def configure(self, settings: dict = None):
+        """
+        Define o balanceamento desta instância: os valores de src/config.py, com as chaves
+        de TUNABLE_SETTINGS em settings sobrescrevendo-os. Vale a partir da próxima partida:
+        uma partida em andamento continua com o balanceamento com que começou.
+        """
+        settings = dict(settings or {})
+        unknown = set(settings) - set(TUNABLE_SETTINGS)
+        if unknown:
+            raise ValueError(f"Configurações não ajustáveis: {', '.join(sorted(unknown))}")
+        self._pending_settings = {name: settings.get(name, getattr(config, name)) for name in TUNABLE_SETTINGS}
+
+    def _apply_settings(self):
+        """Aplica o balanceamento pendente de configure (no início de uma partida)."""
+        settings, self._pending_settings = self._pending_settings, None
+        if settings is None:
+            return
+        self.settings = settings
+        self.enemy_speed = self.settings['ENEMY_SPEED']
+        self.bullet_speed = self.settings['BULLET_SPEED']
+        self.spawn_rate = self.settings['SPAWN_RATE']
+        self.player_lives = self.settings['PLAYER_LIVES']
+
+        if self.entity_backend == 'objects':
+            # Pools reaproveitam inimigos e tiros destruídos em vez de criar novos
+            self.enemy_pool = EntityPool(partial(Enemy, speed=self.enemy_speed), ENEMY_POOL_SIZE)
+            self.bullet_pool = EntityPool(partial(Bullet, speed=self.bullet_speed), BULLET_POOL_SIZE)
+            if self.assets_ready:
+                self.enemy_pool.warm()
+                self.bullet_pool.warm()
+            self.enemies = []
+            self.bullets = []
 
     def init_game_objects(self):
+        self._apply_settings()
         self.player = Player()
-        self.enemies = []
-        self.bullets = []
+        if self.entity_backend == 'arrays':
+            self.enemies = store.EnemyArrays(speed=self.enemy_speed)
+            self.bullets = store.BulletArrays(speed=self.bullet_speed)
+        else:
+            self.enemy_pool.release_all(self.enemies)
+            self.bullet_pool.release_all(self.bullets)
         self.score = 0
-        self.lives = PLAYER_LIVES
+        self.lives = self.player_lives
         self.frame_count = 0
+        self._pending_shots = 0
+
+    def _apply_assets(self):
+        """Aplica, na thread principal, o que o AssetLoader carregou e cria as entidades."""
+        loader = self.assets
+        with self.startup.step('aplicar assets'):
+            for (image_path, size, alpha), surface in loader.images.items():
+                if surface is not None:
+                    sprite_cache.put(image_path, size, surface, alpha)
+            if loader.images.get((BACKGROUND_IMAGE, (RENDER_WIDTH, RENDER_HEIGHT), False)) is not None:
+                self.background = sprite_cache.get(BACKGROUND_IMAGE, (RENDER_WIDTH, RENDER_HEIGHT), alpha=False)
+            if loader.fonts:
+                self.font, self.font_big, self.font_small = loader.fonts
+                self.text_cache.clear()
+                self._hud = None
+            self.sfx_shoot = loader.sfx_shoot
+            self.sfx_explosion = loader.sfx_explosion
+            self.voices.bind({'shoot': self.sfx_shoot, 'explosion': self.sfx_explosion})
+            if loader.music_loaded:
+                pygame.mixer.music.play(-1)  # O '-1' faz a música repetir para sempre (loop)
+
+            self.assets_ready = True
+            self._frame_signature = None
+            if self.entity_backend == 'objects':
+                self.enemy_pool.warm()
+                self.bullet_pool.warm()
+            self.init_game_objects()
+        self.startup.mark_assets_ready()
+
+    def finish_loading(self):
+        """Espera o carregamento em segundo plano terminar e aplica os assets."""
+        if not self.assets_ready:
+            self.assets.wait()
+            self._apply_assets()
+
+    def poll_assets(self):
+        """
+        Chamado a cada frame: aplica os assets assim que a thread termina e inicia a partida
+        pedida durante o carregamento. Depois do primeiro frame, imprime o relatório de startup.
+        """
+        if not self.assets_ready:
+            if not self.assets.done:
+                return
+            self.finish_loading()
+            # Só vale se o jogador continua no MENU em que apertou ENTER
+            start, self._start_requested = self._start_requested, False
+            if start and self.state == 'MENU':
+                self.start_game()
+        if self._report_pending and self.startup.first_frame is not None:
+            self._report_pending = False
+            self.startup.print()
+
+    def start_game(self, seed: int = None):
+        """Inicia (ou reinicia) uma partida; a mesma seed com os mesmos comandos repete a partida."""
+        # Nenhuma partida começa sem sprites e sons
+        self.finish_loading()
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.state = 'PLAYING'
+        self.init_game_objects()
+        if self.record_replays:
+            self.recorder = ReplayRecorder(seed, self.settings)
+
+    def save_replay(self):
+        """Grava a partida em andamento/encerrada em REPLAY_DIR."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None or recorder.ticks == 0:
+            return
+        # Microssegundos no nome: duas partidas salvas no mesmo segundo com a mesma seed
+        # (ex.: seed fixa em testes) não se sobrescrevem
+        now = time.time_ns()
+        stamp = f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(now // 10**9))}_{now // 1000 % 10**6:06d}"
+        path = os.path.join(REPLAY_DIR, f"{stamp}_{recorder.seed}.dgr")
+        try:
+            size = recorder.save(path, self.score)
+            print(f"Replay salvo em {path} ({size} bytes, {recorder.ticks} ticks)")
+        except Exception as e:
+            print(f"Erro ao salvar replay: {e}")
+
+    def shoot(self):
+        """Dispara um tiro a partir do centro do jogador."""
+        self.voices.play('shoot')
+
+        x = self.player.rect.centerx - BULLET_SIZE[0] // 2
+        y = self.player.rect.top
+        if self.entity_backend == 'arrays':
+            self.bullets.spawn(x, y)
+        else:
+            self.bullets.append(self.bullet_pool.acquire(x, y))
+
+    def spawn_enemy(self, x, y):
+        """Cria um inimigo na posição dada."""
+        if self.entity_backend == 'arrays':
+            self.enemies.spawn(x, y)
+        else:
+            self.enemies.append(self.enemy_pool.acquire(x, y))
+
+    def read_controls(self) -> Controls:
+        """Monta os comandos do tick a partir do teclado e dos tiros recebidos em handle_events."""
+        controls = Controls.from_keyboard(fire=self._pending_shots)
+        self._pending_shots = 0
+        return controls
 
     def handle_events(self):
+        self.poll_assets()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Janela voltou a ficar visível: a próxima renderização deve ser completa
+                self._frame_signature = None
+
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.toggle_overlay()
+                elif event.key == pygame.K_F4 and self.profiler:
+                    self.profiler.export_trace(PROFILER_TRACE_PATH)
+                    print(f"Trace salvo em {PROFILER_TRACE_PATH}")
+
                 if self.state == 'MENU':
                     if event.key == pygame.K_RETURN:
-                        self.state = 'PLAYING'
-                        self.init_game_objects()
+                        if self.assets_ready:
+                            self.start_game()
+                        else:
+                            # Começa assim que o carregamento terminar (ver poll_assets)
+                            self._start_requested = True
                     elif event.key == pygame.K_r:
+                        # Saiu do MENU: o ENTER dado durante o carregamento perde o efeito
+                        self._start_requested = False
                         self.state = 'RANKING'
 
                 elif self.state == 'PLAYING':
                     if event.key == pygame.K_SPACE:
-                        if self.sfx_shoot: self.sfx_shoot.play()
-
-                        new_bullet = Bullet(
-                            self.player.rect.centerx - BULLET_SIZE[0] // 2,
-                            self.player.rect.top
-                        )
-                        self.bullets.append(new_bullet)
+                        # O tiro é disparado no update deste frame (ver read_controls)
+                        self._pending_shots += 1
 
                 elif self.state == 'ENTER_NAME':
                     if event.key == pygame.K_RETURN and len(self.player_name) > 0:
@@ -113,8 +332,7 @@ class Game:
 
                 elif self.state == 'GAME_OVER':
                     if event.key == pygame.K_r:
-                        self.state = 'PLAYING'
-                        self.init_game_objects()
+                        self.start_game()
                     elif event.key == pygame.K_ESCAPE:
                         self.state = 'MENU'
 
@@ -122,43 +340,126 @@ class Game:
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
                         self.state = 'MENU'
 
-    def update(self):
+    def update(self, controls: Controls = None):
         if self.state == 'PLAYING':
-            self.player.update()
+            if controls is None:
+                controls = Controls()
+            for _ in range(controls.fire):
+                self.shoot()
+
+            self.player.update(controls)
 
             self.frame_count += 1
-            if self.frame_count >= SPAWN_RATE:
-                rand_x = random.randint(0, SCREEN_WIDTH - ENEMY_SIZE[0])
-                self.enemies.append(Enemy(rand_x, -40))
+            if self.frame_count >= self.spawn_rate:
+                rand_x = self.rng.randint(0, SCREEN_WIDTH - ENEMY_SIZE[0])
+                self.spawn_enemy(rand_x, -40)
                 self.frame_count = 0
 
-            for enemy in self.enemies: enemy.update()
-            for bullet in self.bullets: bullet.update()
+            if self.entity_backend == 'arrays':
+                self.enemies.update()
+                self.bullets.update()
+            else:
+                for enemy in self.enemies: enemy.update()
+                for bullet in self.bullets: bullet.update()
 
-            self.check_collisions()
+            if self.profiler:
+                start = time.perf_counter_ns()
+                self.check_collisions()
+                self.profiler.add('collisions', time.perf_counter_ns() - start)
+            else:
+                self.check_collisions()
             self.check_escaped_enemies()
 
-            self.enemies = [e for e in self.enemies if e.is_active]
-            self.bullets = [b for b in self.bullets if b.is_active]
+            if self.entity_backend == 'arrays':
+                self.enemies.compact()
+                self.bullets.compact()
+            else:
+                self.enemy_pool.compact(self.enemies)
+                self.bullet_pool.compact(self.bullets)
+
+            if self.recorder:
+                self.recorder.record(controls, self.state != 'PLAYING')
+                if self.state != 'PLAYING':
+                    self.save_replay()
+
+        # Uma voz por categoria com o que foi pedido neste tick
+        self.voices.flush()
+
+    def pool_stats(self) -> dict:
+        """Ocupação e pico de uso dos pools de inimigos e tiros."""
+        if self.entity_backend != 'objects':
+            return {}
+        return {'enemies': self.enemy_pool.stats(), 'bullets': self.bullet_pool.stats()}
 
     def check_collisions(self):
-        for bullet in self.bullets:
-            for enemy in self.enemies:
-                if bullet.rect.colliderect(enemy.rect):
-                    if self.sfx_explosion: self.sfx_explosion.play()
+        if self.entity_backend == 'arrays':
+            self._check_collisions_arrays()
+            return
 
-                    bullet.destroy()
-                    enemy.destroy()
-                    self.score += 10
+        if self.collision_mode == 'brute':
+            pairs = brute_force_pairs(self.bullets, self.enemies)
+        else:
+            pairs = spatial_hash_pairs(self.bullets, self.enemies, self.collision_grid)
+            if self.collision_mode == 'compare':
+                expected = brute_force_pairs(self.bullets, self.enemies)
+                if pairs != expected:
+                    self.collision_mismatches += 1
+                    print(f"Divergência na colisão: grade={pairs} força bruta={expected}")
+                    pairs = expected
+
+        if pairs:
+            self.voices.play('explosion', len(pairs))
+        for b_idx, e_idx in pairs:
+            self.bullets[b_idx].destroy()
+            self.enemies[e_idx].destroy()
+            self.score += 10
+
+        if self.collision_mode == 'brute':
+            player_hit = any(enemy.rect.colliderect(self.player.rect) for enemy in self.enemies)
+        else:
+            # A grade já contém todos os inimigos deste tick
+            player_hit = bool(self.collision_grid.query(self.player.rect))
 
-        for enemy in self.enemies:
-            if enemy.rect.colliderect(self.player.rect):
-                # Colisão direta com player = Game Over instantâneo
-                self.trigger_game_over()
-                return
+        if player_hit:
+            # Colisão direta com player = Game Over instantâneo
+            self.trigger_game_over()
+
+    def _check_collisions_arrays(self):
+        """Versão vetorizada de check_collisions, com a mesma semântica."""
+        if self.collision_mode == 'brute':
+            hit_bullets, hit_enemies = array_brute_force_pairs(self.bullets, self.enemies)
+        else:
+            hit_bullets, hit_enemies = array_sweep_pairs(self.bullets, self.enemies)
+            if self.collision_mode == 'compare':
+                expected = array_brute_force_pairs(self.bullets, self.enemies)
+                if not (store.np.array_equal(hit_bullets, expected[0])
+                        and store.np.array_equal(hit_enemies, expected[1])):
+                    self.collision_mismatches += 1
+                    print("Divergência na colisão vetorizada")
+                    hit_bullets, hit_enemies = expected
+
+        hits = len(hit_bullets)
+        if hits:
+            self.voices.play('explosion', hits)
+            self.bullets.destroy(hit_bullets)
+            self.enemies.destroy(hit_enemies)
+            self.score += 10 * hits
+
+        if array_hits_rect(self.enemies, self.player.rect):
+            # Colisão direta com player = Game Over instantâneo
+            self.trigger_game_over()
 
     def check_escaped_enemies(self):
         """Verifica inimigos que escaparam e reduz vidas."""
+        if self.entity_backend == 'arrays':
+            escaped = self.enemies.escaped_count()
+            if escaped:
+                # Igual ao laço: desconta uma vida por fuga e para ao chegar a zero
+                self.lives -= min(escaped, self.lives)
+                if self.lives <= 0:
+                    self.trigger_game_over()
+            return
+
         for enemy in self.enemies:
             if enemy.escaped:
                 self.lives -= 1
@@ -176,37 +477,100 @@ class Game:
             self.state = 'GAME_OVER'
 
     def draw_text_centered(self, text, font, color, y_offset=0):
-        surface = font.render(text, True, color)
-        rect = surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + y_offset))
+        surface = self.text_cache.render(font, text, color)
+        rect = surface.get_rect(center=(RENDER_WIDTH // 2, RENDER_HEIGHT // 2 + round(y_offset * SCALE_Y)))
         self.screen.blit(surface, rect)
 
     def draw(self):
+        # Com o overlay visível a tela inteira é redesenhada, pois o gráfico muda a cada frame
+        if self.render_mode == 'dirty' and not self.show_overlay:
+            self._draw_dirty()
+            return
+
+        self._frame_signature = None
+        self.draw_background()
+        self.draw_scene()
+        if self.show_overlay:
+            self.draw_overlay()
+
+        self.present()
+
+    def present(self, rects=None):
+        """Envia o frame para a janela: a tela inteira ou apenas os retângulos dados."""
+        if self.headless:
+            return
+        start = time.perf_counter_ns() if self.profiler else 0
+        self.presenter.present(rects)
+        if self.startup.first_frame is None:
+            self.startup.mark_first_frame()
+        if self.profiler:
+            self.profiler.add('flip', time.perf_counter_ns() - start)
+
+    def draw_background(self, area=None):
+        """Desenha o fundo na tela inteira ou apenas na área informada."""
         if self.background:
-            self.screen.blit(self.background, (0, 0))
+            if area is None:
+                self.screen.blit(self.background, (0, 0))
+            else:
+                self.screen.blit(self.background, area, area)
         else:
-            self.screen.fill(BLACK)
+            self.screen.fill(BLACK, area)
+
+    def _cursor_visible(self) -> bool:
+        return pygame.time.get_ticks() % 1000 < 500
+
+    def _static_signature(self):
+        """Tudo o que pode mudar o conteúdo de uma tela estática."""
+        if self.state == 'ENTER_NAME':
+            return (self.state, self.score, self.player_name, self._cursor_visible())
+        if self.state == 'GAME_OVER':
+            return (self.state, self.score)
+        return (self.state,)
+
+    def _draw_dirty(self):
+        """
+        Renderização incremental: telas estáticas são desenhadas uma vez e depois ficam ociosas;
+        durante o jogo, só as áreas ocupadas no frame anterior e no atual são restauradas e enviadas.
+        """
+        if self.state != 'PLAYING' or self._frame_signature != ('PLAYING',):
+            signature = self._static_signature()
+            if signature == self._frame_signature:
+                return
+            self._frame_signature = signature
+            self.draw_background()
+            self._dirty_rects = self.draw_scene()
+            self.present()
+            return
+
+        for rect in self._dirty_rects:
+            self.draw_background(rect)
+        rects = self.draw_playing()
+        self.present(self._dirty_rects + rects)
+        self._dirty_rects = rects
+
+    def draw_scene(self) -> list:
+        """
+        Desenha o conteúdo do estado atual (sem o fundo).
+
+        Returns:
+            Retângulos alterados durante o jogo (vazio nas telas estáticas)
+        """
+        if self.state == 'PLAYING':
+            return self.draw_playing()
 
         if self.state == 'MENU':
             self.draw_text_centered("DEFENSOR GALÁCTICO", self.font_big, GREEN, -50)
             self.draw_text_centered("Pressione ENTER para Iniciar", self.font, WHITE, 30)
             self.draw_text_centered("Pressione 'R' para ver Ranking", self.font, WHITE, 70)
-
-        elif self.state == 'PLAYING':
-            self.player.draw(self.screen)
-            for enemy in self.enemies: enemy.draw(self.screen)
-            for bullet in self.bullets: bullet.draw(self.screen)
-            # HUD: Score e Vidas
-            score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_text, (10, 10))
-            lives_text = self.font.render(f"Vidas: {'| ' * self.lives}", True, RED)
-            self.screen.blit(lives_text, (SCREEN_WIDTH - 150, 10))
+            if not self.assets_ready:
+                self.draw_text_centered("Carregando...", self.font, WHITE, 130)
 
         elif self.state == 'ENTER_NAME':
             self.draw_text_centered("NOVO RECORDE!", self.font_big, GREEN, -100)
             self.draw_text_centered(f"Score: {self.score}", self.font, WHITE, -40)
             self.draw_text_centered("Digite seu nome:", self.font, WHITE, 10)
             # Desenha o nome com cursor piscante
-            name_display = self.player_name + ("_" if pygame.time.get_ticks() % 1000 < 500 else " ")
+            name_display = self.player_name + ("_" if self._cursor_visible() else " ")
             self.draw_text_centered(name_display, self.font_big, WHITE, 60)
             self.draw_text_centered("Pressione ENTER para confirmar", self.font, WHITE, 130)
 
@@ -218,7 +582,105 @@ class Game:
         elif self.state == 'RANKING':
             self.draw_ranking_screen()
 
-        pygame.display.flip()
+        return []
+
+    def draw_playing(self) -> list:
+        """Desenha jogador, inimigos, tiros e HUD, retornando as áreas alteradas."""
+        screen = self.screen
+        alpha = self.interpolation
+        rects = [self.player.draw(screen, alpha)]
+        if self.sprite_batching:
+            rects += self._draw_batched(alpha)
+        else:
+            enemies, bullets = self.enemies, self.bullets
+            if self.entity_backend == 'arrays':
+                enemies, bullets = enemies.views(alpha), bullets.views(alpha)
+                alpha = 1.0  # As visões já vêm interpoladas
+            for enemy in enemies: rects.append(enemy.draw(screen, alpha))
+            for bullet in bullets: rects.append(bullet.draw(screen, alpha))
+        # HUD: Score e Vidas
+        score_text, lives_text = self._hud_surfaces()
+        rects.append(screen.blit(score_text, to_render(10, 10)))
+        rects.append(screen.blit(lives_text, to_render(SCREEN_WIDTH - 150, 10)))
+        return rects
+
+    def _draw_batched(self, alpha) -> list:
+        """
+        Desenha inimigos e tiros com um único Surface.blits (agrupados por superfície: todos os
+        inimigos, depois todos os tiros). Entidades sem imagem caem no Entity.draw individual.
+
+        Returns:
+            Áreas alteradas, só no modo 'dirty' (no modo 'full' o blits não monta a lista)
+        """
+        if self.entity_backend == 'arrays':
+            enemy_seq, enemy_fallback = self.enemies.blit_sequence(alpha)
+            bullet_seq, bullet_fallback = self.bullets.blit_sequence(alpha)
+            fallback_alpha = 1.0  # As visões já vêm interpoladas
+        else:
+            enemy_seq, enemy_fallback = Entity.blit_sequence(self.enemies, alpha)
+            bullet_seq, bullet_fallback = Entity.blit_sequence(self.bullets, alpha)
+            fallback_alpha = alpha
+
+        want_rects = self.render_mode == 'dirty'
+        rects = []
+        if enemy_seq or bullet_seq:
+            result = self.screen.blits(enemy_seq + bullet_seq, doreturn=want_rects)
+            if want_rects:
+                rects = result
+        for entity in enemy_fallback: rects.append(entity.draw(self.screen, fallback_alpha))
+        for entity in bullet_fallback: rects.append(entity.draw(self.screen, fallback_alpha))
+        return rects
+
+    def _hud_surfaces(self):
+        """Textos do HUD, renderizados novamente só quando score ou vidas mudam."""
+        hud = self._hud
+        if hud is None or hud[0] != self.score or hud[1] != self.lives:
+            hud = (
+                self.score,
+                self.lives,
+                self.font.render(f"Score: {self.score}", True, WHITE),
+                self.font.render(f"Vidas: {'| ' * self.lives}", True, RED),
+            )
+            self._hud = hud
+        return hud[2], hud[3]
+
+    def toggle_overlay(self):
+        """Mostra/esconde o overlay de desempenho, ligando o profiler se necessário."""
+        if self.profiler is None:
+            self.profiler = FrameProfiler(PROFILER_FRAMES, 1000 / FPS)
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self):
+        """Overlay com FPS, percentis, frames perdidos, entidades, sons e gráfico do tempo de frame."""
+        profiler = self.profiler
+        # Medidas em coordenadas de jogo, levadas para a resolução interna como o resto do frame
+        panel = pygame.Rect(to_render(SCREEN_WIDTH - 250, SCREEN_HEIGHT - 146), render_size((240, 136)))
+        self.screen.fill(BLACK, panel)
+
+        lines = (
+            f"FPS {profiler.fps():.1f}   perdidos {profiler.dropped_frames}",
+            f"p50 {profiler.percentile_ms(50):.1f}  p95 {profiler.percentile_ms(95):.1f}  "
+            f"p99 {profiler.percentile_ms(99):.1f} ms",
+            f"inimigos {len(self.enemies)}   tiros {len(self.bullets)}",
+            f"sons {self.voices.played}/{self.voices.requested}   descartados {self.voices.dropped}",
+        )
+        for i, line in enumerate(lines):
+            text = self.font_small.render(line, True, WHITE)
+            x, y = to_render(5, 4 + i * 16)
+            self.screen.blit(text, (panel.x + x, panel.y + y))
+
+        # Gráfico: uma coluna por frame, com a linha do orçamento (1000 / FPS ms)
+        x, y = to_render(5, 72)
+        graph = pygame.Rect((panel.x + x, panel.y + y), render_size((230, 60)))
+        budget_ms = 1000 / FPS
+        scale = graph.height / (budget_ms * 2)
+        for x, frame_ms in enumerate(profiler.frame_times_ms()[-graph.width:]):
+            height = min(graph.height, int(frame_ms * scale))
+            color = GREEN if frame_ms <= budget_ms * 1.5 else RED
+            pygame.draw.line(self.screen, color, (graph.x + x, graph.bottom - 1),
+                             (graph.x + x, graph.bottom - 1 - height))
+        budget_y = graph.bottom - 1 - int(budget_ms * scale)
+        pygame.draw.line(self.screen, WHITE, (graph.x, budget_y), (graph.right, budget_y))
 
     def draw_ranking_screen(self):
         """Desenha a tela de ranking com top 10 scores."""
@@ -232,27 +694,115 @@ class Game:
                 self.draw_text_centered("Nenhum score registrado", self.font, WHITE, 0)
             else:
                 # Cabeçalho da tabela
-                header_y = SCREEN_HEIGHT // 2 - 150
-                header = self.font.render("POS   NOME         SCORE      DATA", True, GREEN)
-                header_rect = header.get_rect(center=(SCREEN_WIDTH // 2, header_y))
+                header_y = RENDER_HEIGHT // 2 - round(150 * SCALE_Y)
+                header = self.text_cache.render(self.font, "POS   NOME         SCORE      DATA", GREEN)
+                header_rect = header.get_rect(center=(RENDER_WIDTH // 2, header_y))
                 self.screen.blit(header, header_rect)
 
                 # Linhas do ranking
                 for i, (pos, name, score, date) in enumerate(scores):
-                    y_pos = header_y + 35 + (i * 30)
+                    y_pos = header_y + round((35 + i * 30) * SCALE_Y)
                     # Formata a linha com espaçamento fixo
                     line = f"{pos:>2}º    {name:<10}   {score:>6}     {date}"
                     color = WHITE if i > 2 else [GREEN, WHITE, RED][i]  # Top 3 colorido
-                    text = self.font.render(line, True, color)
-                    text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+                    text = self.text_cache.render(self.font, line, color)
+                    text_rect = text.get_rect(center=(RENDER_WIDTH // 2, y_pos))
                     self.screen.blit(text, text_rect)
 
         self.draw_text_centered("Pressione ESC ou ENTER para voltar", self.font, WHITE, 220)
 
+    def step(self, controls: Controls = None) -> str:
+        """
+        Avança a simulação exatamente um tick, sem ler o teclado nem esperar o relógio.
+
+        Args:
+            controls: Comandos do tick (None = nenhuma tecla pressionada)
+
+        Returns:
+            O estado do jogo após o tick
+        """
+        self.update(controls)
+        if self.render:
+            self.draw()
+        return self.state
+
     def run(self):
         while self.running:
+            if self.profiler:
+                self._run_profiled_frame()
+                continue
             self.handle_events()
-            self.update()
+            self._advance()
+            if self.render:
+                self.draw()
+            if not self.headless:
+                self.clock.tick(RENDER_FPS_LIMIT)
+
+        if self.profiler and PROFILER_ENABLED:
+            self.profiler.export_trace(PROFILER_TRACE_PATH)
+
+        # Partida interrompida ao fechar a janela também é gravada
+        self.save_replay()
+
+        # Garante que nenhuma pontuação enfileirada se perca ao sair
+        if self.ranking_db:
+            self.ranking_db.close()
+        pygame.quit()
+
+    def _advance(self) -> int:
+        """
+        Roda os ticks de simulação devidos desde o frame anterior (passo fixo com acumulador).
+
+        Se o jogo atrasar, recupera até MAX_TICKS_PER_FRAME ticks por frame e descarta o resto,
+        para que um frame lento não gere frames ainda mais lentos (spiral of death).
+        Headless roda exatamente um tick por frame, o mais rápido possível.
+
+        Returns:
+            Quantidade de ticks executados
+        """
+        if self.headless:
+            self.update(self.read_controls())
+            return 1
+
+        now = time.perf_counter_ns()
+        if self._last_frame_ns is None:
+            self._last_frame_ns = now - self._tick_ns
+        self._accumulator += now - self._last_frame_ns
+        self._last_frame_ns = now
+
+        ticks = 0
+        while self._accumulator >= self._tick_ns:
+            if ticks == MAX_TICKS_PER_FRAME:
+                self.skipped_ticks += self._accumulator // self._tick_ns
+                self._accumulator %= self._tick_ns
+                break
+            self.update(self.read_controls())
+            self._accumulator -= self._tick_ns
+            ticks += 1
+
+        self.interpolation = self._accumulator / self._tick_ns
+        return ticks
+
+    def _run_profiled_frame(self):
+        """Um frame de run() com cada fase cronometrada (ver src/profiler.py)."""
+        profiler = self.profiler
+        clock = time.perf_counter_ns
+        profiler.begin_frame()
+
+        start = clock()
+        self.handle_events()
+        after_events = clock()
+        self._advance()
+        after_update = clock()
+        if self.render:
             self.draw()
-            self.clock.tick(FPS)
-        pygame.quit()
\ No newline at end of file
+        after_draw = clock()
+        if not self.headless:
+            self.clock.tick(RENDER_FPS_LIMIT)
+        end = clock()
+
+        profiler.add('events', after_events - start)
+        profiler.add('update', after_update - after_events)
+        profiler.add('draw', after_draw - after_update)
+        profiler.add('sleep', end - after_draw)
+        profiler.end_frame()
@@ -0,0 +1,173 @@
+# src/loader.py
+"""
+Carregamento dos assets em segundo plano e relatório do tempo de inicialização.
+
+O jogo abre a janela e mostra o MENU com o mínimo (pygame.init, janela, fonte padrão);
+áudio, fontes do sistema, sprites e background são lidos por uma thread. Só o que exige a
+janela (converter as superfícies para o formato da tela) fica para a thread principal,
+em Game._apply_assets.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pygame
+
+from src.config import *
+from src.assets import sprite_cache
+from src.bundle import AssetBundle
+from src.render import render_size, font_size
+
+SOUNDS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+
+# Sprites decodificados pelo carregador, já no tamanho da resolução interna: (caminho, tamanho, alpha)
+SPRITES = (
+    (PLAYER_IMAGE, render_size(PLAYER_SIZE), True),
+    (ENEMY_IMAGE, render_size(ENEMY_SIZE), True),
+    (BULLET_IMAGE, render_size(BULLET_SIZE), True),
+    (BACKGROUND_IMAGE, (RENDER_WIDTH, RENDER_HEIGHT), False),
+)
+# Efeitos sonoros guardados em PCM no pacote de assets (a música continua tocando direto do arquivo)
+SOUNDS = (
+    os.path.join(SOUNDS_DIR, 'shoot.mp3'),
+    os.path.join(SOUNDS_DIR, 'explosion.mp3'),
+)
+
+
+class StartupReport:
+    """Duração de cada etapa da inicialização, medida a partir da criação do relatório."""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.steps = []  # (etapa, thread, início em s, duração em s)
+        self.first_frame = None
+        self.assets_ready = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def step(self, name: str):
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            entry = (name, threading.current_thread().name, start, self.elapsed() - start)
+            with self._lock:
+                self.steps.append(entry)
+
+    def mark_first_frame(self):
+        if self.first_frame is None:
+            self.first_frame = self.elapsed()
+
+    def mark_assets_ready(self):
+        if self.assets_ready is None:
+            self.assets_ready = self.elapsed()
+
+    def lines(self) -> list:
+        with self._lock:
+            steps = sorted(self.steps, key=lambda entry: entry[2])
+        lines = [f"  {start * 1000:8.1f} ms  +{duration * 1000:7.1f} ms  {name} ({thread})"
+                 for name, thread, start, duration in steps]
+        if self.first_frame is not None:
+            lines.append(f"  primeiro frame em {self.first_frame * 1000:.1f} ms")
+        if self.assets_ready is not None:
+            lines.append(f"  assets prontos em {self.assets_ready * 1000:.1f} ms")
+        return lines
+
+    def print(self):
+        print("Inicialização:")
+        for line in self.lines():
+            print(line)
+
+
+class AssetLoader:
+    """
+    Lê sons, fontes e imagens. start() roda em uma thread; load() roda na thread atual.
+    Os resultados ficam nos atributos até serem aplicados pelo jogo.
+
+    Sprites e sons vêm do pacote de assets quando ele existe e está em dia; o que faltar
+    nele é decodificado dos arquivos originais.
+    """
+
+    def __init__(self, report: StartupReport, bundle_path: str = None):
+        self._report = report
+        self._bundle_path = bundle_path
+        self.bundle = None  # Mantido aberto: as superfícies do pacote apontam para o mmap
+        self.from_bundle = 0  # Assets que vieram do pacote
+        self._thread = None
+        self._done = threading.Event()
+        self.sfx_shoot = None
+        self.sfx_explosion = None
+        self.music_loaded = False
+        self.fonts = None  # (normal, grande, pequena)
+        self.images = {}  # (caminho, tamanho, alpha) -> superfície decodificada ou None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.load, name='assets', daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self):
+        """Bloqueia até o carregamento terminar (imediato se já terminou)."""
+        self._done.wait()
+
+    def load(self):
+        try:
+            if self._bundle_path:
+                with self._report.step('abrir pacote de assets'):
+                    self.bundle = AssetBundle.open(self._bundle_path)
+            self._load_audio()
+            with self._report.step('fontes do sistema'):
+                self.fonts = (pygame.font.SysFont("Arial", font_size(24)),
+                              pygame.font.SysFont("Arial", font_size(48)),
+                              pygame.font.SysFont("Arial", font_size(14)))
+            with self._report.step('decodificar imagens'):
+                for image_path, size, alpha in SPRITES:
+                    surface = self.bundle.image(image_path, size, alpha) if self.bundle is not None else None
+                    if surface is not None:
+                        self.from_bundle += 1
+                    else:
+                        surface = self._decode(image_path, size)
+                    self.images[(image_path, size, alpha)] = surface
+        finally:
+            self._done.set()
+
+    def _load_audio(self):
+        try:
+            with self._report.step('mixer.init'):
+                pygame.mixer.init()
+            with self._report.step('decodificar sons'):
+                # Efeitos Sonoros (SFX)
+                sfx_shoot, sfx_explosion = (self._sound(path) for path in SOUNDS)
+                # Ajuste de volume (0.0 a 1.0)
+                sfx_shoot.set_volume(0.3)
+                sfx_explosion.set_volume(0.5)
+            with self._report.step('carregar música'):
+                pygame.mixer.music.load(os.path.join(SOUNDS_DIR, 'background.mp3'))
+                pygame.mixer.music.set_volume(0.2)  # Música mais baixa para não atrapalhar
+            self.sfx_shoot, self.sfx_explosion = sfx_shoot, sfx_explosion
+            self.music_loaded = True
+        except Exception as e:
+            print(f"Erro ao carregar sons: {e}")
+            print("O jogo continuará sem som.")
+
+    def _sound(self, sound_path):
+        sound = self.bundle.sound(sound_path) if self.bundle is not None else None
+        if sound is not None:
+            self.from_bundle += 1
+            return sound
+        return pygame.mixer.Sound(sound_path)
+
+    @staticmethod
+    def _decode(image_path, size):
+        try:
+            return sprite_cache.decode(image_path, size)
+        except Exception as e:
+            print(f"Erro ao carregar {os.path.basename(image_path)}: {e}")
+            return None
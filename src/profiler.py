@@ -0,0 +1,117 @@
+# src/profiler.py
+"""
+Instrumentação do loop do jogo: tempo de cada fase por frame em um buffer circular,
+percentis do tempo de frame, frames perdidos e exportação para um arquivo de trace
+(formato Chrome Trace Event, abre em chrome://tracing ou https://ui.perfetto.dev).
+"""
+import json
+import time
+from array import array
+
+# Fases do frame, na ordem em que acontecem em Game.run
+PHASES = ('events', 'update', 'collisions', 'draw', 'flip', 'sleep')
+# Fases medidas por dentro de outras: o tempo delas é descontado da fase externa
+NESTED = {'collisions': 'update', 'flip': 'draw'}
+
+
+class FrameProfiler:
+    """
+    Guarda os últimos N frames em arrays de tamanho fixo (sem alocação por frame).
+    """
+
+    def __init__(self, capacity: int, frame_budget_ms: float):
+        """
+        Args:
+            capacity: Quantidade de frames mantidos no buffer circular
+            frame_budget_ms: Duração esperada de um frame (ex.: 1000 / FPS)
+        """
+        self._capacity = capacity
+        self._budget_ns = int(frame_budget_ms * 1_000_000)
+        self._phases = {phase: array('q', bytes(8 * capacity)) for phase in PHASES}
+        self._frame_ns = array('q', bytes(8 * capacity))
+        self._frame_start = array('q', bytes(8 * capacity))
+        self._current = dict.fromkeys(PHASES, 0)
+        self._index = 0
+        self._count = 0
+        self._start_ns = 0
+        self._origin_ns = time.perf_counter_ns()
+        self.dropped_frames = 0
+        self.total_frames = 0
+
+    def begin_frame(self):
+        self._start_ns = time.perf_counter_ns()
+        current = self._current
+        for phase in PHASES:
+            current[phase] = 0
+
+    def add(self, phase: str, duration_ns: int):
+        """Soma a duração (ns) a uma fase do frame atual."""
+        self._current[phase] += duration_ns
+
+    def end_frame(self):
+        now = time.perf_counter_ns()
+        i = self._index
+        current = self._current
+        for inner, outer in NESTED.items():
+            current[outer] = max(0, current[outer] - current[inner])
+        for phase in PHASES:
+            self._phases[phase][i] = current[phase]
+
+        frame = now - self._start_ns
+        self._frame_ns[i] = frame
+        self._frame_start[i] = self._start_ns - self._origin_ns
+        # Frame perdido: passou do orçamento por mais de meio frame (pulou um refresh)
+        if self._budget_ns and frame > self._budget_ns * 3 // 2:
+            self.dropped_frames += 1
+        self.total_frames += 1
+
+        self._index = (i + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def _ordered_indices(self):
+        """Índices do buffer do frame mais antigo para o mais recente."""
+        start = (self._index - self._count) % self._capacity
+        return [(start + k) % self._capacity for k in range(self._count)]
+
+    def frame_times_ms(self) -> list:
+        """Tempos de frame (ms) do mais antigo para o mais recente."""
+        return [self._frame_ns[i] / 1_000_000 for i in self._ordered_indices()]
+
+    def percentile_ms(self, p: float) -> float:
+        """Percentil p (0-100) do tempo de frame nos frames do buffer."""
+        if self._count == 0:
+            return 0.0
+        ordered = sorted(self._frame_ns[i] for i in range(self._count))
+        k = min(self._count - 1, int(round(p / 100 * (self._count - 1))))
+        return ordered[k] / 1_000_000
+
+    def phase_means_ms(self) -> dict:
+        """Média (ms) de cada fase nos frames do buffer."""
+        if self._count == 0:
+            return dict.fromkeys(PHASES, 0.0)
+        return {phase: sum(samples[:self._count]) / self._count / 1_000_000
+                for phase, samples in self._phases.items()}
+
+    def fps(self) -> float:
+        if self._count == 0:
+            return 0.0
+        mean_ns = sum(self._frame_ns[:self._count]) / self._count
+        return 1_000_000_000 / mean_ns if mean_ns else 0.0
+
+    def export_trace(self, path: str):
+        """Grava os frames do buffer como eventos 'X' (duração) do Chrome Trace Event."""
+        events = []
+        for i in self._ordered_indices():
+            ts = self._frame_start[i] / 1000  # microssegundos
+            events.append({'name': 'frame', 'ph': 'X', 'ts': ts,
+                           'dur': self._frame_ns[i] / 1000, 'pid': 1, 'tid': 1})
+            # As fases são exclusivas e sequenciais, então podem ser empilhadas no tempo
+            offset = ts
+            for phase in PHASES:
+                dur = self._phases[phase][i] / 1000
+                if dur:
+                    events.append({'name': phase, 'ph': 'X', 'ts': offset, 'dur': dur, 'pid': 1, 'tid': 2})
+                    offset += dur
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -5,116 +5,575 @@ Responsável por persistir e recuperar as melhores pontuações.
 """
 import sqlite3
 import os
-from datetime import datetime
-from src.config import DB_PATH, MAX_RANKING_ENTRIES
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from itertools import islice
+from datetime import datetime, timezone
+from src.config import (DB_PATH, MAX_RANKING_ENTRIES, RANKING_SYNCHRONOUS, RANKING_KEEP_ENTRIES,
+                        RANKING_LEADERBOARD_MODE, RANKING_RETENTION_ENTRIES,
+                        RANKING_RETENTION_INTERVAL, RANKING_RETENTION_BATCH, RANKING_IMPORT_BATCH,
+                        RANKING_SHARED, RANKING_SHARED_CHECK_INTERVAL, RANKING_BUSY_TIMEOUT, RANKING_MAX_RETRIES,
+                        RANKING_RETRY_BASE_DELAY, RANKING_COALESCE_WRITES)
+
+
+# Comandos SQL fixos e parametrizados: com a conexão persistente,
+# o sqlite3 reaproveita a versão compilada de cada um (cache de statements).
+SQL_INSERT = 'INSERT INTO rankings (player_name, score) VALUES (?, ?)'
+SQL_COUNT_ABOVE = 'SELECT COUNT(*) FROM rankings WHERE score > ?'
+SQL_TOP_SCORES = '''
+    SELECT player_name, score, created_at 
+    FROM rankings 
+    ORDER BY score DESC 
+    LIMIT ?
+'''
+# Não apaga nada se o banco estiver no modo leaderboard (ver SQL_IS_LEADERBOARD), mesmo que
+# outra conexão o tenha convertido depois que esta foi aberta
+SQL_CLEANUP = '''
+    DELETE FROM rankings 
+    WHERE NOT EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_counts')
+    AND id NOT IN (
+        SELECT id FROM rankings ORDER BY score DESC LIMIT ?
+    )
+'''
+
+
+# Modo leaderboard: score_counts guarda quantas linhas existem para cada score,
+# mantida por triggers. Posição, percentil e corte do top N percorrem só os scores
+# distintos (chave primária), sem depender do número de linhas em rankings.
+# A existência de score_counts é o que marca um banco como leaderboard
+SQL_IS_LEADERBOARD = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_counts'"
+SQL_CREATE_SCORE_COUNTS = '''
+    CREATE TABLE score_counts (
+        score INTEGER PRIMARY KEY,
+        n INTEGER NOT NULL
+    ) WITHOUT ROWID
+'''
+SQL_FILL_SCORE_COUNTS = 'INSERT INTO score_counts (score, n) SELECT score, COUNT(*) FROM rankings GROUP BY score'
+SQL_SCORE_COUNT_TRIGGERS = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_rankings_insert AFTER INSERT ON rankings BEGIN
+        INSERT INTO score_counts (score, n) VALUES (NEW.score, 1)
+        ON CONFLICT(score) DO UPDATE SET n = n + 1;
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_rankings_delete AFTER DELETE ON rankings BEGIN
+        UPDATE score_counts SET n = n - 1 WHERE score = OLD.score;
+        DELETE FROM score_counts WHERE score = OLD.score AND n <= 0;
+    END
+    ''',
+)
+SQL_LB_COUNT_ABOVE = 'SELECT COALESCE(SUM(n), 0) FROM score_counts WHERE score > ?'
+SQL_LB_COUNT_BELOW = 'SELECT COALESCE(SUM(n), 0) FROM score_counts WHERE score < ?'
+SQL_LB_TOTAL = 'SELECT COALESCE(SUM(n), 0) FROM score_counts'
+SQL_LB_SCORES_DESC = 'SELECT score, n FROM score_counts ORDER BY score DESC'
+SQL_COUNT_BELOW = 'SELECT COUNT(*) FROM rankings WHERE score < ?'
+SQL_TOTAL = 'SELECT COUNT(*) FROM rankings'
+SQL_SCORES_DESC = 'SELECT score, COUNT(*) FROM rankings GROUP BY score ORDER BY score DESC'
+SQL_IMPORT = '''
+    INSERT INTO rankings (player_name, score, created_at) 
+    VALUES (?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+'''
+SQL_EXPORT_PAGE = '''
+    SELECT id, player_name, score, created_at 
+    FROM rankings 
+    WHERE id > ? 
+    ORDER BY id 
+    LIMIT ?
+'''
+SQL_RETENTION_BATCH = '''
+    DELETE FROM rankings 
+    WHERE id IN (SELECT id FROM rankings WHERE score < ? LIMIT ?)
+'''
+
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    """True se o erro indica que outro processo está segurando o lock do banco."""
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
 
 
 class RankingDB:
     """
     Classe para gerenciar o banco de dados de ranking.
     Demonstra: Encapsulamento e Persistência de Dados.
+    
+    Mantém uma única conexão aberta (em modo WAL) durante toda a vida do objeto;
+    use close() ou um bloco with para liberá-la.
     """
     
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, async_writes: bool = False,
+                 synchronous: str = RANKING_SYNCHRONOUS,
+                 leaderboard: bool = None,
+                 retention: int = RANKING_RETENTION_ENTRIES,
+                 shared: bool = RANKING_SHARED,
+                 coalesce_writes: int = RANKING_COALESCE_WRITES):
+        """
+        Args:
+            db_path: Caminho do arquivo SQLite
+            async_writes: Se True, as gravações são feitas por uma thread dedicada
+                e save_score retorna imediatamente (ver flush/close)
+            synchronous: Nível do PRAGMA synchronous ('OFF', 'NORMAL', 'FULL' ou 'EXTRA')
+            leaderboard: Se True, guarda o histórico completo e não limpa a cada inserção.
+                O modo fica gravado no banco: None segue o do banco (ou RANKING_LEADERBOARD_MODE
+                se ele é novo), True converte um banco comum e False em um banco leaderboard
+                levanta ValueError, para que o histórico nunca seja apagado por engano
+            retention: No modo leaderboard, quantas melhores pontuações a retenção
+                periódica mantém (None = nunca apaga)
+            shared: Se True, o banco é usado por outros processos ao mesmo tempo e a
+                cópia em memória é recarregada quando eles gravam
+            coalesce_writes: No modo assíncrono, quantas gravações enfileiradas podem
+                ser agrupadas em uma única transação (1 = sem agrupamento)
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Nível de synchronous inválido: {synchronous}")
+        
         self._db_path = db_path
-        self._init_db()
+        self._leaderboard = leaderboard
+        self._retention = retention
+        self._inserts_since_retention = 0
+        self._shared = shared
+        self._data_version = None
+        self._version_checked_at = None  # time.monotonic() da última leitura de data_version
+        self._coalesce = max(1, coalesce_writes)
+        self._round_trips = 0
+        self._busy_retries = 0
+        # Cópia em memória do topo do ranking, já com as datas formatadas (None = não carregada).
+        # Lida e trocada sob self._lock: a thread de escrita pode invalidá-la (retenção)
+        self._top_snapshot = None
+        self._snapshot_limit = 0
+        
+        # Conexão única, compartilhada com a thread de escrita e protegida por lock.
+        # Sem isolation_level: as transações são abertas explicitamente em _transaction.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, timeout=RANKING_BUSY_TIMEOUT,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(f'PRAGMA synchronous={synchronous}')
+        try:
+            self._init_db()
+        except BaseException:
+            self._conn.close()
+            raise
+
+        self._async = async_writes
+        self._queue = None
+        self._writer = None
+        if async_writes:
+            # Carrega o topo agora: no modo assíncrono a cópia em memória é a fonte da verdade
+            self.get_top_scores()
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._writer_loop, name='RankingWriter', daemon=True)
+            self._writer.start()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Cria e retorna uma conexão com o banco de dados."""
-        return sqlite3.connect(self._db_path)
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    @contextmanager
+    def _transaction(self, immediate: bool = False):
+        """
+        Executa um bloco de comandos em uma transação da conexão persistente.
+        
+        Args:
+            immediate: Reserva o lock de escrita já no início (BEGIN IMMEDIATE), evitando
+                que duas transações de escrita concorrentes travem uma à outra
+        """
+        with self._lock:
+            self._round_trips += 1
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+            try:
+                yield cursor
+                # O COMMIT também pode falhar (ex.: SQLITE_BUSY); a transação não pode ficar aberta
+                cursor.execute('COMMIT')
+            except BaseException:
+                if self._conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                raise
+    
+    def _write(self, work):
+        """
+        Executa work(cursor) em uma transação de escrita, repetindo-a com backoff
+        exponencial se outro processo mantiver o banco ocupado além do busy timeout.
+        
+        Returns:
+            O valor retornado por work
+        """
+        delay = RANKING_RETRY_BASE_DELAY
+        for attempt in range(RANKING_MAX_RETRIES + 1):
+            try:
+                with self._transaction(immediate=True) as cursor:
+                    return work(cursor)
+            except sqlite3.OperationalError as e:
+                if not _is_busy(e) or attempt == RANKING_MAX_RETRIES:
+                    raise
+                self._busy_retries += 1
+                time.sleep(delay * (1 + random.random()))
+                delay *= 2
+    
+    @property
+    def round_trips(self) -> int:
+        """Quantidade de acessos reais ao banco de dados desde a criação do objeto."""
+        return self._round_trips
+    
+    @property
+    def busy_retries(self) -> int:
+        """Quantas transações precisaram ser repetidas por causa de lock de outro processo."""
+        return self._busy_retries
+    
+    def invalidate_cache(self):
+        """Descarta a cópia em memória do ranking; a próxima leitura consulta o banco."""
+        with self._lock:
+            self._top_snapshot = None
     
     def _init_db(self):
         """Cria a tabela de ranking se não existir."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS rankings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    player_name TEXT NOT NULL DEFAULT 'AAA',
-                    score INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            # Índice para otimizar consultas por score
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_score ON rankings(score DESC)
-            ''')
-            conn.commit()
+        self._write(self._create_schema)
+    
+    @property
+    def leaderboard(self) -> bool:
+        """True se o banco está no modo leaderboard (histórico completo)."""
+        return self._leaderboard
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Cria a tabela, o índice e (no modo leaderboard) a contagem por score."""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS rankings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_name TEXT NOT NULL DEFAULT 'AAA',
+                score INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # Índice para otimizar consultas por score
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_score ON rankings(score DESC)
+        ''')
+        is_leaderboard = cursor.execute(SQL_IS_LEADERBOARD).fetchone() is not None
+        if is_leaderboard and self._leaderboard is False:
+            raise ValueError(f"{self._db_path} está no modo leaderboard; abra-o com leaderboard=None ou True")
+        if self._leaderboard is None:
+            self._leaderboard = is_leaderboard or RANKING_LEADERBOARD_MODE
+        if self._leaderboard:
+            self._init_score_counts(cursor)
+    
+    def _init_score_counts(self, cursor: sqlite3.Cursor):
+        """Cria (e preenche a partir das linhas existentes) a tabela de contagem por score."""
+        if cursor.execute(SQL_IS_LEADERBOARD).fetchone() is None:
+            cursor.execute(SQL_CREATE_SCORE_COUNTS)
+            cursor.execute(SQL_FILL_SCORE_COUNTS)
+        for sql in SQL_SCORE_COUNT_TRIGGERS:
+            cursor.execute(sql)
     
     def save_score(self, player_name: str, score: int) -> int:
         """
         Salva uma pontuação no ranking.
         
+        No modo assíncrono a gravação é enfileirada para a thread de escrita
+        e a posição é calculada a partir da cópia em memória do topo.
+        
         Args:
             player_name: Nome do jogador (máx 10 caracteres)
             score: Pontuação obtida
             
         Returns:
             Posição no ranking (1-10) ou -1 se não entrou no top 10
+            
+        Raises:
+            sqlite3.ProgrammingError: Se o objeto já foi fechado (close)
+        """
+        if self._conn is None:
+            # Sem a thread de escrita a pontuação ficaria só na cópia em memória e se perderia
+            raise sqlite3.ProgrammingError("RankingDB já foi fechado")
+        player_name = player_name[:10]  # Limita nome a 10 caracteres
+        if self._async:
+            position = self._insert_into_snapshot(player_name, score)
+            self._queue.put((player_name, score))
+            return position
+
+        position = self._write_scores([(player_name, score)])[0]
+        self.invalidate_cache()
+        return position if position <= MAX_RANKING_ENTRIES else -1
+    
+    def _write_scores(self, entries: list) -> list:
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        Insere as pontuações e calcula a posição de cada uma na mesma transação
+        (atômico mesmo com outros processos gravando), depois limpa o histórico.
+        
+        Args:
+            entries: Lista de tuplas (nome, score)
             
-            # Insere a nova pontuação
-            cursor.execute(
-                'INSERT INTO rankings (player_name, score) VALUES (?, ?)',
-                (player_name[:10], score)  # Limita nome a 10 caracteres
-            )
-            conn.commit()
+        Returns:
+            Lista com a posição absoluta de cada pontuação
+        """
+        count_above = SQL_LB_COUNT_ABOVE if self._leaderboard else SQL_COUNT_ABOVE
+        
+        def work(cursor):
+            positions = []
+            for player_name, score in entries:
+                # Insere a nova pontuação
+                cursor.execute(SQL_INSERT, (player_name, score))
+                
+                # Calcula a posição no ranking
+                cursor.execute(count_above, (score,))
+                positions.append(cursor.fetchone()[0] + 1)
             
-            # Calcula a posição no ranking
-            cursor.execute(
-                'SELECT COUNT(*) FROM rankings WHERE score > ?',
-                (score,)
-            )
-            position = cursor.fetchone()[0] + 1
+            if not self._leaderboard:
+                # Limpa registros antigos além do top entries (mantém histórico limitado)
+                self._cleanup_old_entries(cursor)
+            return positions
+        
+        positions = self._write(work)
+        
+        if self._leaderboard and self._retention is not None:
+            # Retenção em lotes: um lote limitado a cada RANKING_RETENTION_INTERVAL inserções
+            self._inserts_since_retention += len(entries)
+            if self._inserts_since_retention >= RANKING_RETENTION_INTERVAL:
+                self._inserts_since_retention = 0
+                self.run_retention(max_batches=1)
+        return positions
+    
+    def _insert_into_snapshot(self, player_name: str, score: int) -> int:
+        """
+        Atualiza a cópia em memória com uma nova pontuação (após as de score igual).
+        
+        Returns:
+            Posição no ranking (1-10) ou -1 se não entrou no top 10
+        """
+        rows = self._snapshot(self._snapshot_limit, revalidate=True)
+        # Mesma regra do modo síncrono: posição = quantos têm score estritamente maior + 1
+        position = sum(1 for row in rows if row[2] > score) + 1
+        
+        index = sum(1 for row in rows if row[2] >= score)
+        if index < self._snapshot_limit:
+            # Mesma data que a linha gravada terá no banco (CURRENT_TIMESTAMP do SQLite é UTC)
+            new_row = (index + 1, player_name, score, datetime.now(timezone.utc).strftime('%d/%m/%y'))
+            # Renumera as posições abaixo da nova pontuação
+            shifted = [(pos + 1, name, s, date) for pos, name, s, date in rows[index:]]
+            with self._lock:
+                # Se a cópia foi invalidada nesse meio tempo, a próxima leitura recarrega do banco
+                # (já com esta pontuação, pois recarregar espera a fila de escrita)
+                if self._top_snapshot is rows:
+                    self._top_snapshot = (rows[:index] + [new_row] + shifted)[:self._snapshot_limit]
+        
+        return position if position <= MAX_RANKING_ENTRIES else -1
+    
+    def _writer_loop(self):
+        """
+        Thread de escrita: consome a fila usando a conexão persistente, agrupando em uma
+        só transação as gravações que já estiverem esperando (até coalesce_writes).
+        """
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < self._coalesce and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+                self._queue.task_done()
+            try:
+                if batch:
+                    self._write_scores(batch)
+            except Exception as e:
+                print(f"Erro ao salvar pontuações: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def flush(self):
+        """Aguarda até que todas as gravações enfileiradas tenham sido concluídas."""
+        # Dentro da própria thread de escrita (ex.: retenção automática) não há o que esperar
+        if threading.current_thread() is self._writer:
+            return
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+    
+    def close(self):
+        """Conclui as gravações pendentes, encerra a thread de escrita e fecha a conexão."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _cleanup_old_entries(self, cursor: sqlite3.Cursor, keep_entries: int = RANKING_KEEP_ENTRIES):
+        """Remove entradas antigas mantendo apenas as melhores."""
+        cursor.execute(SQL_CLEANUP, (keep_entries,))
+    
+    def run_retention(self, keep_entries: int = None, batch_size: int = RANKING_RETENTION_BATCH,
+                      max_batches: int = None) -> int:
+        """
+        Apaga, em lotes de transações curtas, as pontuações abaixo do corte das melhores.
+        
+        Pontuações empatadas com o corte são mantidas, então podem sobrar um pouco mais
+        de keep_entries linhas.
+        
+        Args:
+            keep_entries: Quantas melhores pontuações manter (padrão: retention do objeto)
+            batch_size: Máximo de linhas apagadas por transação
+            max_batches: Limite de lotes nesta chamada (None = até terminar)
             
-            # Limpa registros antigos além do top entries (mantém histórico limitado)
-            self._cleanup_old_entries(cursor)
-            conn.commit()
+        Returns:
+            Quantidade de linhas apagadas
+        """
+        keep_entries = self._retention if keep_entries is None else keep_entries
+        if keep_entries is None:
+            return 0
+        self.flush()
+        
+        cutoff = self.score_needed_for_top(keep_entries)
+        if cutoff is None:
+            return 0
+        
+        deleted = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            removed = self._write(lambda cursor: cursor.execute(SQL_RETENTION_BATCH, (cutoff, batch_size)).rowcount)
+            deleted += removed
+            batches += 1
+            if removed < batch_size:
+                break
+        if deleted:
+            self.invalidate_cache()
+        return deleted
+    
+    def import_scores(self, rows, batch_size: int = RANKING_IMPORT_BATCH, progress=None) -> int:
+        """
+        Insere pontuações em massa, consumindo o iterável aos poucos (memória constante).
+        
+        Args:
+            rows: Iterável de tuplas (nome, score, created_at); created_at pode ser None
+            batch_size: Linhas por transação (executemany)
+            progress: Função opcional chamada com o total de linhas já inseridas
             
-            return position if position <= MAX_RANKING_ENTRIES else -1
+        Returns:
+            Quantidade de linhas inseridas
+        """
+        self.flush()
+        rows = iter(rows)
+        total = 0
+        while True:
+            batch = [(name[:10], int(score), created_at) for name, score, created_at in islice(rows, batch_size)]
+            if not batch:
+                break
+            self._write(lambda cursor: cursor.executemany(SQL_IMPORT, batch))
+            total += len(batch)
+            if progress:
+                progress(total)
+        
+        if total and not self._leaderboard:
+            # Mesmo limite de histórico do modo padrão, aplicado uma única vez no fim
+            self._write(self._cleanup_old_entries)
+        self.invalidate_cache()
+        return total
     
-    def _cleanup_old_entries(self, cursor: sqlite3.Cursor, keep_entries: int = 100):
-        """Remove entradas antigas mantendo apenas as melhores."""
-        cursor.execute(f'''
-            DELETE FROM rankings 
-            WHERE id NOT IN (
-                SELECT id FROM rankings ORDER BY score DESC LIMIT {keep_entries}
-            )
-        ''')
+    def iter_scores(self, batch_size: int = RANKING_IMPORT_BATCH):
+        """
+        Percorre todas as pontuações em ordem de inserção, uma página por consulta,
+        sem manter a conexão ocupada entre as páginas.
+        
+        Yields:
+            Tuplas (nome, score, created_at)
+        """
+        self.flush()
+        last_id = 0
+        while True:
+            with self._transaction() as cursor:
+                cursor.execute(SQL_EXPORT_PAGE, (last_id, batch_size))
+                page = cursor.fetchall()
+            if not page:
+                return
+            last_id = page[-1][0]
+            for _, name, score, created_at in page:
+                yield name, score, created_at
     
     def get_top_scores(self, limit: int = MAX_RANKING_ENTRIES) -> list:
         """
         Retorna as melhores pontuações.
         
+        O resultado vem da cópia em memória; o banco só é consultado na primeira
+        leitura após a criação do objeto ou após um save_score.
+        
         Args:
             limit: Número máximo de registros a retornar
             
         Returns:
             Lista de tuplas (posição, nome, score, data)
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT player_name, score, created_at 
-                FROM rankings 
-                ORDER BY score DESC 
-                LIMIT ?
-            ''', (limit,))
-            
-            results = []
-            for idx, row in enumerate(cursor.fetchall(), start=1):
-                name, score, created_at = row
-                # Formata a data para DD/MM/YY
-                try:
-                    dt = datetime.fromisoformat(created_at)
-                    date_str = dt.strftime('%d/%m/%y')
-                except:
-                    date_str = '--/--/--'
-                results.append((idx, name, score, date_str))
-            
-            return results
+        return self._snapshot(limit)[:limit]
+    
+    def _snapshot(self, limit: int, revalidate: bool = False) -> list:
+        """
+        Cópia em memória com pelo menos limit linhas (se houver), recarregada se preciso.
+        
+        No modo compartilhado a cópia é conferida com o banco no máximo a cada
+        RANKING_SHARED_CHECK_INTERVAL segundos (a tela de ranking lê a cada frame), ou
+        sempre com revalidate=True, usado quando a resposta decide posição/recorde.
+        """
+        if self._shared and self._top_snapshot is not None and self._changed_by_others(revalidate):
+            self.invalidate_cache()
+        
+        with self._lock:
+            rows = self._top_snapshot
+        # Recarrega se não há cópia ou se pediram mais linhas do que as carregadas (e pode haver mais)
+        if rows is None or (limit > self._snapshot_limit and len(rows) == self._snapshot_limit):
+            # Gravações pendentes precisam estar no banco antes de recarregar; fora do lock,
+            # que a thread de escrita precisa para gravá-las
+            self.flush()
+            with self._lock:
+                self._snapshot_limit = max(limit, MAX_RANKING_ENTRIES)
+                rows = self._top_snapshot = self._load_top_scores(self._snapshot_limit)
+        return rows
+    
+    def _changed_by_others(self, force: bool = False) -> bool:
+        """
+        True se outra conexão gravou no banco desde a última carga da cópia em memória.
+        Sem force, não consulta o banco (e responde False) antes do intervalo de revalidação.
+        """
+        now = time.monotonic()
+        if not force and now - self._version_checked_at < RANKING_SHARED_CHECK_INTERVAL:
+            return False
+        self._version_checked_at = now
+        with self._transaction() as cursor:
+            version = cursor.execute('PRAGMA data_version').fetchone()[0]
+        return version != self._data_version
+    
+    def _load_top_scores(self, limit: int) -> list:
+        """Consulta as melhores pontuações no banco e formata as datas."""
+        with self._transaction() as cursor:
+            cursor.execute(SQL_TOP_SCORES, (limit,))
+            rows = cursor.fetchall()
+            # data_version só muda com commits de outras conexões (ver _changed_by_others)
+            self._data_version = cursor.execute('PRAGMA data_version').fetchone()[0]
+            self._version_checked_at = time.monotonic()
+        
+        results = []
+        for idx, row in enumerate(rows, start=1):
+            name, score, created_at = row
+            # Formata a data para DD/MM/YY
+            try:
+                dt = datetime.fromisoformat(created_at)
+                date_str = dt.strftime('%d/%m/%y')
+            except:
+                date_str = '--/--/--'
+            results.append((idx, name, score, date_str))
+        
+        return results
     
     def is_high_score(self, score: int) -> bool:
         """
@@ -128,25 +587,17 @@ class RankingDB:
         """
         if score <= 0:
             return False
-            
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM rankings')
-            total = cursor.fetchone()[0]
-            
-            # Se ainda não temos 10 scores, qualquer score positivo entra
-            if total < MAX_RANKING_ENTRIES:
-                return True
-            
-            # Verifica se o score é maior que o menor score do top 10
-            cursor.execute('''
-                SELECT MIN(score) FROM (
-                    SELECT score FROM rankings ORDER BY score DESC LIMIT ?
-                )
-            ''', (MAX_RANKING_ENTRIES,))
-            min_top_score = cursor.fetchone()[0]
-            
-            return score > min_top_score
+        
+        # Respondido pela cópia em memória do topo (revalidada se o banco é compartilhado)
+        top = self._snapshot(MAX_RANKING_ENTRIES, revalidate=True)[:MAX_RANKING_ENTRIES]
+        
+        # Se ainda não temos 10 scores, qualquer score positivo entra
+        if len(top) < MAX_RANKING_ENTRIES:
+            return True
+        
+        # Verifica se o score é maior que o menor score do top 10
+        min_top_score = top[-1][2]
+        return score > min_top_score
     
     def get_rank_position(self, score: int) -> int:
         """
@@ -158,10 +609,42 @@ class RankingDB:
         Returns:
             Posição no ranking (1 = primeiro lugar)
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT COUNT(*) FROM rankings WHERE score > ?',
-                (score,)
-            )
+        self.flush()
+        with self._transaction() as cursor:
+            cursor.execute(SQL_LB_COUNT_ABOVE if self._leaderboard else SQL_COUNT_ABOVE, (score,))
             return cursor.fetchone()[0] + 1
+    
+    def get_percentile(self, score: int) -> float:
+        """
+        Retorna a porcentagem (0-100) de pontuações registradas estritamente menores que score.
+        
+        Args:
+            score: Pontuação a verificar
+        """
+        self.flush()
+        with self._transaction() as cursor:
+            cursor.execute(SQL_LB_TOTAL if self._leaderboard else SQL_TOTAL)
+            total = cursor.fetchone()[0]
+            if total == 0:
+                return 0.0
+            cursor.execute(SQL_LB_COUNT_BELOW if self._leaderboard else SQL_COUNT_BELOW, (score,))
+            return 100.0 * cursor.fetchone()[0] / total
+    
+    def score_needed_for_top(self, n: int):
+        """
+        Retorna a menor pontuação que hoje ocuparia uma posição <= n (mesma regra de
+        get_rank_position), ou None se ainda há menos de n pontuações registradas.
+        
+        Args:
+            n: Tamanho do topo (ex.: 10 para o top 10)
+        """
+        self.flush()
+        with self._transaction() as cursor:
+            # Percorre os scores distintos do maior para o menor até acumular n linhas
+            cursor.execute(SQL_LB_SCORES_DESC if self._leaderboard else SQL_SCORES_DESC)
+            accumulated = 0
+            for score, count in cursor:
+                accumulated += count
+                if accumulated >= n:
+                    return score
+        return None
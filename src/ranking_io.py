@@ -0,0 +1,137 @@
+# src/ranking_io.py
+"""
+Importação e exportação em massa do ranking em CSV e JSONL.
+Os arquivos são lidos e escritos linha a linha, então o uso de memória não depende do tamanho.
+"""
+import csv
+import json
+import os
+import time
+
+from src.config import RANKING_IMPORT_BATCH
+
+FORMATS = ('csv', 'jsonl')
+CSV_HEADER = ('player_name', 'score', 'created_at')
+
+
+class TransferStats:
+    """Resultado de uma importação/exportação: linhas, tempo e vazão."""
+
+    def __init__(self, rows: int, seconds: float):
+        self.rows = rows
+        self.seconds = seconds
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self):
+        return f"TransferStats(rows={self.rows}, seconds={self.seconds:.2f}, rows_per_sec={self.rows_per_sec:.0f})"
+
+
+def detect_format(path: str) -> str:
+    """Deduz o formato pela extensão do arquivo."""
+    # .json não é aceito: um array JSON não pode ser lido linha a linha como JSONL
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext not in FORMATS:
+        raise ValueError(f"Formato não reconhecido para {path} (use .csv ou .jsonl)")
+    return ext
+
+
+def read_csv(path: str):
+    """Gera (nome, score, created_at) a partir de um CSV com cabeçalho."""
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield row['player_name'], int(row['score']), row.get('created_at') or None
+
+
+def read_jsonl(path: str):
+    """Gera (nome, score, created_at) a partir de um arquivo JSON Lines."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                yield item['player_name'], int(item['score']), item.get('created_at')
+
+
+def write_csv(path: str, rows) -> int:
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_jsonl(path: str, rows) -> int:
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for name, score, created_at in rows:
+            f.write(json.dumps({'player_name': name, 'score': score, 'created_at': created_at},
+                               ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+READERS = {'csv': read_csv, 'jsonl': read_jsonl}
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl}
+
+
+def _with_progress(progress, start):
+    """Adapta o callback do usuário para receber (linhas, linhas/s)."""
+    if progress is None:
+        return None
+
+    def report(rows):
+        elapsed = time.perf_counter() - start
+        progress(rows, rows / elapsed if elapsed > 0 else 0.0)
+    return report
+
+
+def import_file(db, path: str, fmt: str = None, batch_size: int = RANKING_IMPORT_BATCH,
+                progress=None) -> TransferStats:
+    """
+    Importa um arquivo para o RankingDB em transações de batch_size linhas.
+
+    Args:
+        db: Instância de RankingDB
+        path: Arquivo de origem
+        fmt: 'csv' ou 'jsonl' (padrão: pela extensão)
+        batch_size: Linhas por transação
+        progress: Função opcional chamada com (linhas, linhas/s) a cada lote
+    """
+    fmt = fmt or detect_format(path)
+    start = time.perf_counter()
+    rows = db.import_scores(READERS[fmt](path), batch_size, _with_progress(progress, start))
+    return TransferStats(rows, time.perf_counter() - start)
+
+
+def export_file(db, path: str, fmt: str = None, batch_size: int = RANKING_IMPORT_BATCH,
+                progress=None) -> TransferStats:
+    """
+    Exporta todas as pontuações do RankingDB, página a página.
+
+    Args:
+        db: Instância de RankingDB
+        path: Arquivo de destino
+        fmt: 'csv' ou 'jsonl' (padrão: pela extensão)
+        batch_size: Linhas lidas por consulta
+        progress: Função opcional chamada com (linhas, linhas/s) a cada lote
+    """
+    fmt = fmt or detect_format(path)
+    start = time.perf_counter()
+    report = _with_progress(progress, start)
+
+    def rows():
+        for count, row in enumerate(db.iter_scores(batch_size), start=1):
+            if report and count % batch_size == 0:
+                report(count)
+            yield row
+
+    total = WRITERS[fmt](path, rows())
+    if report:
+        report(total)
+    return TransferStats(total, time.perf_counter() - start)
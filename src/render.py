@@ -0,0 +1,95 @@
+# src/render.py
+"""
+Resolução interna de renderização.
+
+A simulação continua em coordenadas de jogo (SCREEN_WIDTH x SCREEN_HEIGHT). O desenho é feito
+em uma superfície de RENDER_WIDTH x RENDER_HEIGHT, com sprites e fundo já redimensionados para
+ela (o SpriteCache guarda uma cópia por tamanho), e essa superfície é escalada uma única vez
+por frame para a janela (WINDOW_WIDTH x WINDOW_HEIGHT). Com os três tamanhos iguais (padrão),
+o jogo desenha direto na janela, como antes.
+"""
+import pygame
+
+from src.config import *
+
+SCALE_X = RENDER_WIDTH / SCREEN_WIDTH
+SCALE_Y = RENDER_HEIGHT / SCREEN_HEIGHT
+# False no caso comum: as funções abaixo nem chegam a ser chamadas no desenho
+SCALED = (RENDER_WIDTH, RENDER_HEIGHT) != (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+
+def to_render(x, y):
+    """Converte uma posição em coordenadas de jogo para a superfície de renderização."""
+    return round(x * SCALE_X), round(y * SCALE_Y)
+
+
+def render_size(size):
+    """Tamanho em pixels, na resolução interna, de algo com o tamanho size em coordenadas de jogo."""
+    return max(1, round(size[0] * SCALE_X)), max(1, round(size[1] * SCALE_Y))
+
+
+def font_size(points: int) -> int:
+    return max(1, round(points * SCALE_Y))
+
+
+class Presenter:
+    """
+    Abre a janela e entrega a superfície onde o jogo desenha. Se a resolução interna difere
+    da janela, present() escala o frame inteiro para a janela, mantendo a proporção
+    (faixas pretas nas sobras).
+    """
+
+    def __init__(self, window_size, render_size, scaling=RENDER_SCALING, vsync=False):
+        self.window = self._open(window_size, vsync)
+        window_size = self.window.get_size()
+        if window_size == tuple(render_size):
+            self.surface = self.window
+            self._target = None
+            return
+
+        self.surface = pygame.Surface(render_size).convert()
+        self._smooth = scaling == 'smooth'
+        self.rect = self._fit(window_size, render_size, integer=not self._smooth)
+        # Escala direto em uma subsuperfície da janela, sem alocar um frame novo a cada present
+        self._target = self.window.subsurface(self.rect)
+        self.window.fill(BLACK)
+
+    @staticmethod
+    def _open(size, vsync):
+        if vsync:
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"VSync indisponível: {e}")
+        return pygame.display.set_mode(size)
+
+    @staticmethod
+    def _fit(window_size, render_size, integer):
+        """Maior área com a proporção da resolução interna que cabe na janela, centralizada."""
+        ww, wh = window_size
+        rw, rh = render_size
+        scale = min(ww / rw, wh / rh)
+        if integer and scale >= 1:
+            scale = int(scale)  # Escala inteira: pixels nítidos e sem distorção
+        width, height = round(rw * scale), round(rh * scale)
+        return pygame.Rect((ww - width) // 2, (wh - height) // 2, width, height)
+
+    @property
+    def scaled(self) -> bool:
+        return self._target is not None
+
+    def present(self, rects=None):
+        """Envia o frame para a tela (tela inteira, ou só os retângulos quando não há escala)."""
+        if self._target is None:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+
+        # A escala já percorre o frame inteiro: retângulos sujos não economizariam nada aqui
+        if self._smooth:
+            pygame.transform.smoothscale(self.surface, self.rect.size, self._target)
+        else:
+            pygame.transform.scale(self.surface, self.rect.size, self._target)
+        pygame.display.flip()
@@ -0,0 +1,247 @@
+# src/replay.py
+"""
+Gravação e reprodução determinística de partidas.
+
+Uma partida é reproduzível a partir da seed do gerador de números aleatórios do jogo
+e da sequência de Controls de cada tick. O arquivo guarda:
+
+    cabeçalho  magic 'DGRP', versão, seed, ticks, score final e impressão digital da config
+    settings   balanceamento da partida (TUNABLE_SETTINGS), em JSON precedido do tamanho (u16)
+    corpo      ticks codificados em 1 byte (bit 0 esquerda, bit 1 direita, bits 2-3 tiros,
+               bit 4 = a partida saiu de PLAYING neste tick), com 3+ tiros seguidos de um
+               byte com a quantidade; ticks repetidos são agrupados em (byte, repetições)
+               com as repetições em varint
+
+Como as teclas ficam paradas por muitos ticks seguidos, uma partida típica ocupa bem
+menos de 1 byte por tick.
+"""
+import json
+import os
+import struct
+import time
+import zlib
+
+import pygame
+
+from src.config import *
+from src.controls import Controls
+
+MAGIC = b'DGRP'
+VERSION = 2  # A versão 1 não tinha o bloco de settings
+HEADER = struct.Struct('<4sBQIII')  # magic, versão, seed, ticks, score, config
+SETTINGS_SIZE = struct.Struct('<H')
+
+LEFT = 0x01
+RIGHT = 0x02
+FIRE_SHIFT = 2
+FIRE_MASK = 0x0C
+FIRE_EXTENDED = 3  # Valor dos bits de tiro quando a quantidade vem no byte seguinte
+LEFT_PLAYING = 0x10
+
+
+def config_fingerprint(settings: dict = None) -> int:
+    """
+    CRC32 das constantes que afetam a simulação; replays só valem com a mesma config.
+
+    Args:
+        settings: Valores de TUNABLE_SETTINGS usados na partida (padrão: os de src/config.py)
+    """
+    settings = settings or {}
+    values = (SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_SPEED, PLAYER_SIZE,
+              settings.get('PLAYER_LIVES', PLAYER_LIVES), settings.get('ENEMY_SPEED', ENEMY_SPEED),
+              ENEMY_SIZE, settings.get('SPAWN_RATE', SPAWN_RATE),
+              settings.get('BULLET_SPEED', BULLET_SPEED), BULLET_SIZE)
+    return zlib.crc32(repr(values).encode())
+
+
+def _encode_tick(controls: Controls, left_playing: bool) -> bytes:
+    value = (LEFT if controls.left else 0) | (RIGHT if controls.right else 0)
+    if left_playing:
+        value |= LEFT_PLAYING
+    if controls.fire < FIRE_EXTENDED:
+        return bytes((value | controls.fire << FIRE_SHIFT,))
+    return bytes((value | FIRE_EXTENDED << FIRE_SHIFT, min(controls.fire, 255)))
+
+
+def _write_varint(out: bytearray, n: int):
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos: int):
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """
+    Acumula os ticks de uma partida já agrupados em sequências repetidas,
+    então a memória cresce com as mudanças de tecla e não com a duração.
+    """
+
+    def __init__(self, seed: int, settings: dict = None):
+        self.seed = seed
+        self.settings = dict(settings or {})
+        self.config = config_fingerprint(settings)
+        self.ticks = 0
+        self._runs = []  # [tick codificado, repetições]
+
+    def record(self, controls: Controls, left_playing: bool = False):
+        """Registra os comandos de um tick de PLAYING e se a partida terminou nele."""
+        token = _encode_tick(controls, left_playing)
+        self.ticks += 1
+        runs = self._runs
+        if runs and runs[-1][0] == token:
+            runs[-1][1] += 1
+        else:
+            runs.append([token, 1])
+
+    def to_bytes(self, score: int) -> bytes:
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, score, self.config))
+        settings = json.dumps(self.settings, sort_keys=True, separators=(',', ':')).encode()
+        out += SETTINGS_SIZE.pack(len(settings)) + settings
+        for token, count in self._runs:
+            out += token
+            _write_varint(out, count)
+        return bytes(out)
+
+    def save(self, path: str, score: int) -> int:
+        """Grava o replay e retorna o tamanho em bytes."""
+        data = self.to_bytes(score)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+
+
+class Replay:
+    """Replay carregado de um arquivo (ou de bytes)."""
+
+    def __init__(self, seed: int, ticks: int, score: int, config: int, body: bytes, settings: dict = None):
+        self.seed = seed
+        self.ticks = ticks
+        self.score = score
+        self.config = config
+        self.settings = settings  # Balanceamento da gravação (None em replays da versão 1)
+        self._body = body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        magic, version, seed, ticks, score, config = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Arquivo não é um replay do Defensor Galáctico")
+        if version not in (1, VERSION):
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        pos = HEADER.size
+        settings = None
+        if version >= 2:
+            size, = SETTINGS_SIZE.unpack_from(data, pos)
+            pos += SETTINGS_SIZE.size
+            settings = json.loads(bytes(data[pos:pos + size])) or None
+            pos += size
+        return cls(seed, ticks, score, config, bytes(data[pos:]), settings)
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def matches_config(self, settings: dict = None) -> bool:
+        """True se src/config.py com settings (padrão: os gravados no replay) reproduz a partida."""
+        return self.config == config_fingerprint(self.settings if settings is None else settings)
+
+    def __iter__(self):
+        """Gera (Controls, saiu_de_playing) para cada tick gravado."""
+        body = self._body
+        pos = 0
+        while pos < len(body):
+            value = body[pos]
+            pos += 1
+            fire = (value & FIRE_MASK) >> FIRE_SHIFT
+            if fire == FIRE_EXTENDED:
+                fire = body[pos]
+                pos += 1
+            count, pos = _read_varint(body, pos)
+            controls = Controls(value & LEFT, value & RIGHT, fire)
+            left_playing = bool(value & LEFT_PLAYING)
+            for _ in range(count):
+                yield controls, left_playing
+
+
+class ReplayResult:
+    """Resultado de uma reprodução."""
+
+    def __init__(self, ticks, score, expected_score, desync_tick, seconds):
+        self.ticks = ticks
+        self.score = score
+        self.expected_score = expected_score
+        self.desync_tick = desync_tick  # Primeiro tick em que o fim da partida divergiu (ou None)
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.desync_tick is None and self.score == self.expected_score
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.seconds if self.seconds else 0.0
+
+
+def play_replay(replay: Replay, realtime: bool = False, entity_backend: str = ENTITY_BACKEND,
+                settings: dict = None) -> ReplayResult:
+    """
+    Reproduz um replay.
+
+    Args:
+        replay: Replay carregado
+        realtime: True abre a janela e reproduz a FPS; False roda headless o mais rápido possível
+        entity_backend: 'objects' ou 'arrays' (ambos produzem a mesma partida)
+        settings: Balanceamento a usar (padrão: o gravado no replay)
+    """
+    from src.game import Game
+
+    if settings is None:
+        settings = replay.settings
+
+    if not replay.matches_config(settings):
+        print("Aviso: o replay foi gravado com outra configuração; a partida pode divergir.")
+
+    game = Game(headless=not realtime, entity_backend=entity_backend, ranking=False,
+                record_replays=False, settings=settings)
+    game.start_game(replay.seed)
+    desync_tick = None
+    aborted = False
+    ticks = 0
+    start = time.perf_counter()
+
+    for controls, left_playing in replay:
+        if realtime:
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                aborted = True
+                break
+        game.update(controls)
+        if realtime:
+            game.draw()
+            game.clock.tick(FPS)
+        ticks += 1
+        if (game.state != 'PLAYING') != left_playing and desync_tick is None:
+            desync_tick = ticks
+        if game.state != 'PLAYING':
+            break
+
+    seconds = time.perf_counter() - start
+    if ticks < replay.ticks and desync_tick is None and not aborted:
+        desync_tick = ticks
+    score = game.score
+    pygame.quit()
+    return ReplayResult(ticks, score, replay.score, desync_tick, seconds)
@@ -0,0 +1,51 @@
+# src/text_cache.py
+"""
+Cache LRU de textos já renderizados.
+Rasterizar fontes é caro; textos fixos (menus, ranking) são renderizados uma única vez.
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    Guarda superfícies de texto indexadas por (fonte, texto, cor, antialias),
+    descartando as menos usadas quando o limite é atingido.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self._max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Equivalente a font.render(text, antialias, color), reaproveitando o resultado."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self):
+        return len(self._surfaces)
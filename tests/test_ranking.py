@@ -0,0 +1,127 @@
+"""
+Testes do RankingDB.
+
+Nos testes de COMMIT que falha por lock (SQLITE_BUSY), a conexão real é embrulhada para
+que o COMMIT devolva "database is locked" um certo número de vezes; BEGIN, INSERT e
+ROLLBACK continuam indo para o SQLite, então a transação fica de fato aberta quando o
+COMMIT falha, como acontece sob disputa.
+"""
+import sqlite3
+
+import pytest
+
+from src.ranking import RankingDB
+
+
+class _BusyCommitCursor:
+    def __init__(self, cursor, conn):
+        self._cursor = cursor
+        self._conn = conn
+
+    def execute(self, sql, *args):
+        if sql == 'COMMIT' and self._conn.busy_commits > 0:
+            self._conn.busy_commits -= 1
+            raise sqlite3.OperationalError("database is locked")
+        self._cursor.execute(sql, *args)
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _BusyCommitConnection:
+    """Conexão cujos próximos busy_commits COMMITs falham como se outro processo segurasse o lock."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.busy_commits = 0
+
+    def cursor(self):
+        return _BusyCommitCursor(self._conn.cursor(), self)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def db(tmp_path):
+    ranking = RankingDB(str(tmp_path / 'ranking.db'))
+    ranking._conn = _BusyCommitConnection(ranking._conn)
+    yield ranking
+    ranking.close()
+
+
+def test_busy_commit_is_rolled_back_and_retried(db):
+    db._conn.busy_commits = 2
+
+    assert db.save_score('ANA', 50) == 1
+
+    assert db.busy_retries == 2
+    assert not db._conn.in_transaction
+    assert [(name, score) for _, name, score, _ in db.get_top_scores()] == [('ANA', 50)]
+
+
+def test_failed_commit_does_not_leave_transaction_open(db, monkeypatch):
+    monkeypatch.setattr('src.ranking.RANKING_MAX_RETRIES', 0)
+    db._conn.busy_commits = 1
+
+    with pytest.raises(sqlite3.OperationalError, match='locked'):
+        db.save_score('ANA', 50)
+
+    # A inserção foi desfeita e a conexão continua utilizável
+    assert not db._conn.in_transaction
+    assert db.save_score('BIA', 30) == 1
+    assert [(name, score) for _, name, score, _ in db.get_top_scores()] == [('BIA', 30)]
+
+
+def _count(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM rankings').fetchone()[0]
+
+
+def test_leaderboard_mode_is_kept_by_the_database(tmp_path):
+    path = str(tmp_path / 'ranking.db')
+    with RankingDB(path, leaderboard=True) as ranking:
+        ranking.import_scores((f'P{i}', i, None) for i in range(513))
+
+    # Aberto com a configuração padrão (como o jogo faz): segue o modo do banco e não limpa
+    with RankingDB(path) as ranking:
+        assert ranking.leaderboard
+        ranking.save_score('Z', 5)
+        ranking.import_scores([('Y', 1, None)])
+    assert _count(path) == 515
+
+    with pytest.raises(ValueError, match='leaderboard'):
+        RankingDB(path, leaderboard=False)
+
+
+def test_cleanup_skips_database_converted_by_another_connection(tmp_path):
+    path = str(tmp_path / 'ranking.db')
+    with RankingDB(path) as legacy:
+        RankingDB(path, leaderboard=True).close()
+        for score in range(150):
+            legacy.save_score('A', score)
+    assert _count(path) == 150
+
+
+def test_shared_mode_revalidates_at_most_once_per_interval(tmp_path, monkeypatch):
+    path = str(tmp_path / 'ranking.db')
+    clock = [100.0]
+    monkeypatch.setattr('src.ranking.time.monotonic', lambda: clock[0])
+    with RankingDB(path, async_writes=False, shared=True) as ranking, RankingDB(path) as other:
+        ranking.get_top_scores()
+        other.save_score('ANA', 50)
+
+        # Um segundo de frames na tela de ranking: nenhuma ida ao banco
+        round_trips = ranking.round_trips
+        for _ in range(60):
+            assert ranking.get_top_scores() == []
+        assert ranking.round_trips == round_trips
+
+        # Decidir um recorde sempre confere o banco
+        assert ranking.is_high_score(10)
+        assert [(name, score) for _, name, score, _ in ranking.get_top_scores()] == [('ANA', 50)]
+
+        other.save_score('BIA', 70)
+        clock[0] += 1.0
+        assert [(name, score) for _, name, score, _ in ranking.get_top_scores()] == [('BIA', 70), ('ANA', 50)]
@@ -0,0 +1,11 @@
+"""Estresse com vários processos gravando no mesmo banco (benchmarks/ranking_stress.py)."""
+import pytest
+
+from benchmarks import ranking_stress
+
+
+@pytest.mark.parametrize('async_writes', [False, True], ids=['sync', 'async'])
+def test_concurrent_writers_lose_no_scores(async_writes):
+    result = ranking_stress.run(processes=4, scores=200, async_writes=async_writes)
+
+    assert result['ok'], result